@@ -8,7 +8,15 @@ class GameConfig:
     MAIN_WINDOW_SIZE = (300, 450)
     ROOM_WINDOW_SIZE = (400, 400)
     WINDOW_TITLE = "ELECTRIC_PAT"
-    FPS = 6
+    PERSISTENT_WINDOW = True  # 只创建一次窗口，各场景画在居中的视口里，切换场景不再调用set_mode
+    VIEWPORT_BACKGROUND_COLOR = (0, 0, 0)  # 常驻窗口中视口以外区域的颜色
+    FPS = 30  # 渲染帧率（画面刷新频率，与游戏逻辑无关）
+    TICK_RATE = 6  # 模拟频率：每秒更新游戏状态的次数，下面所有以"帧"为单位的游戏数值都按tick计算
+    MAX_TICKS_PER_FRAME = 5  # 卡顿后每帧最多补算的tick数，超出的时间直接丢弃
+
+    # 渲染配置
+    DIRTY_RECT_RENDERING = False  # 只恢复和更新有变化的区域，不再每帧重画整个窗口
+    SKIP_UNCHANGED_FRAMES = True  # 画面内容没有变化时跳过渲染和刷新
 
     # 加载动画配置
     LOADING_FRAME_COUNT = 12
@@ -18,6 +26,42 @@ class GameConfig:
     LOADING_BACKGROUND_COLOR = (139, 69, 19)
     LOADING_TEXT_COLOR = (255, 255, 255)
     LOADING_CAT_SIZE = 80
+    LOADING_STEP_BUDGET_MS = 50  # 每帧推进资源加载的时间预算（毫秒），其余时间留给加载动画
+
+    # 资源加载配置
+    LOADER_WORKERS = 0  # 并行解码动画的线程数（0=按CPU核数自动，1=主线程顺序加载）
+
+    # 资源清单配置（python -m src.utilis.build_manifest 生成）
+    USE_ASSET_MANIFEST = True  # 用清单判断资源是否存在，不再扫描目录
+    ASSET_MANIFEST_FILE = "assets/manifest.json"
+
+    # 资源来源配置（python -m src.utilis.build_pack 打包）
+    ASSET_SOURCE = "loose"  # "loose"=散装 assets 目录，"pack"=单文件资源包
+    ASSET_PACK_FILE = "assets.pak"
+
+    # 纹理图集配置（python -m src.utilis.bake_atlas 烘焙）
+    USE_TEXTURE_ATLAS = True  # 已烘焙图集时优先从图集加载动画
+    ATLAS_DIR = "assets/atlas"
+    ATLAS_INDEX_FILE = "atlas_index.json"
+    ATLAS_MAX_SIZE = 1024  # 单页图集最大边长
+    ATLAS_PADDING = 1  # 帧之间的间隔像素
+
+    # 缩放帧磁盘缓存配置
+    USE_FRAME_CACHE = True  # 缓存缩放后的原始像素，热启动跳过解码和缩放
+    FRAME_CACHE_DIR = "data/cache/frames"
+
+    # 动画按需加载配置
+    LAZY_ANIMATION_LOADING = True  # 首次使用时才加载动画状态
+    ANIMATION_MEMORY_BUDGET = 2 * 1024 * 1024  # 动画帧内存预算（字节），超出时淘汰最久未用的状态
+    COMPACT_FRAMES = False  # 无损时把动画帧存成8位调色板/RLE表面，减少内存
+
+    # 开发用热重载配置
+    HOT_RELOAD = False  # 运行时检测动画帧文件修改并只重载改动的帧
+    HOT_RELOAD_FILES_PER_TICK = 8  # 每帧最多检查的文件数，避免卡顿
+
+    # 渲染基准测试配置（python -m src.utilis.bench_renderers）
+    GOLDEN_FRAME_DIR = "data/golden"  # 基准画面目录（--update-golden 重新生成）
+    BENCH_REPEATS = 500  # 每个渲染器的计时调用次数
 
     # 场景过渡配置
     TRANSITION_DURATION = 30  # 过渡持续帧数
@@ -28,6 +72,8 @@ class GameConfig:
     CAT_DEFAULT_Y = 330
     CAT_TARGET_SIZE = 100
     CAT_ROOM_SIZE = 60
+    # 每个场景使用的猫咪尺寸（同一帧只解码一次，再缩放出所有尺寸）
+    CAT_SCENE_SIZES = {"main": CAT_TARGET_SIZE, "room": CAT_ROOM_SIZE}
     CAT_MOVE_SPEED = 8
 
     # 云朵设置
@@ -37,6 +83,8 @@ class GameConfig:
     CLOUD_SPACING = 10
     CLOUD_OFFSET_Y = -80  # 云朵上方多少像素
     CLOUD_PADDING = 20  # 文字两边的内边距
+    CLOUD_SLICE_INSETS = (60, 130, 238, 199)  # cloud.png 九宫格切片的内距（左, 上, 右, 下，含右下角的尾巴）
+    CLOUD_CACHE_SIZE = 32  # 最多缓存多少个带文字的云朵
 
     # 游戏逻辑数值
     MAX_CONCURRENT_NEEDS = 3  # 最多同时存在3个需求
@@ -14,6 +14,18 @@ class UILayout:
     ROOM_HEALTH_BAR_Y = 30
     ROOM_MOOD_BAR_Y = 60
 
+    # 进度条设置（图片在加载时缩放好，绘制时不再读取文件）
+    PROGRESS_BAR_SIZE = (70, 15)
+    PROGRESS_BAR_PERCENTS = (15, 30, 50, 80, 100)  # progress_bars 目录中每种进度条的档位图片
+    PROGRESS_BAR_FILL_SPAN = (0.045, 0.955)  # 填充区在图片宽度中的起止比例
+    PROGRESS_BAR_FILL_ROWS = (0.14, 0.93)  # 填充区在图片高度中的起止比例（上下边框之内）
+    PROGRESS_BAR_EMPTY_X = 0.85  # 最低档图片中空槽所在的位置比例
+    CONTINUOUS_PROGRESS_BAR = False  # True=按实际数值连续绘制，False=使用五档图片
+
+    # 存档提示
+    SAVE_HINT_TEXT = "F5:Save F9:Load"
+    SAVE_HINT_COLOR = (128, 128, 128)
+
     # 时间显示位置
     TIME_DISPLAY_X = 10
     TIME_DISPLAY_Y = 10
@@ -23,7 +35,22 @@ class UILayout:
     FONT_SIZE_UI = 13
     FONT_SIZE_CLOUD = 14
     FONT_SIZE_TIME = 16
+    FONT_SIZE_LOADING = 24
+    FONT_SIZE_LOADING_PROGRESS = 16
+    FONT_SIZE_SAVE_MESSAGE = 18
+    FONT_SIZE_INFO = 12
     LABEL_OFFSET_Y = -16
+    TEXT_CACHE_SIZE = 128  # 文字表面缓存最多保留的条目数
+    # 渲染器用到的所有字体（字号, 粗体），启动时由 FontRegistry 一次性创建
+    FONT_STYLES = [
+        (FONT_SIZE_UI, True),
+        (FONT_SIZE_CLOUD, True),
+        (FONT_SIZE_TIME, True),
+        (FONT_SIZE_LOADING, True),
+        (FONT_SIZE_LOADING_PROGRESS, False),
+        (FONT_SIZE_SAVE_MESSAGE, True),
+        (FONT_SIZE_INFO, False),
+    ]
 
     # 颜色
     FONT_COLOR = (60, 30, 0)
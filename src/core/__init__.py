@@ -2,7 +2,8 @@
 """核心模块"""
 
 from .game_time import GameTime
-from .scene_manager import GameScene
+from .scene_manager import GameScene, OffscreenScene
 from .cat_state import CatState
+from .simulation import Simulation
 
-__all__ = ['GameTime', 'GameScene', 'CatState']
\ No newline at end of file
+__all__ = ['GameTime', 'GameScene', 'OffscreenScene', 'CatState', 'Simulation']
\ No newline at end of file
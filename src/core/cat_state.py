@@ -13,7 +13,10 @@ class CatState:
     """猫咪状态管理"""
     ANIMATION_STATES = ["hungry", "play", "sleepy", "touch"]
 
-    def __init__(self, game_time):
+    def __init__(self, game_time, rng=None):
+        # 需求生成使用的随机数生成器（每只猫独立，固定种子复现时不影响全局 random）
+        self.rng = rng or random.Random()
+
         # 位置系统
         self.main_x = GameConfig.CAT_DEFAULT_X
         self.main_y = GameConfig.CAT_DEFAULT_Y
@@ -23,6 +26,8 @@ class CatState:
         self.default_room_y = 255
         self.target_x = self.room_x
         self.target_y = self.room_y
+        self.prev_room_x = self.room_x  # 上一个tick的房间位置（渲染插值用）
+        self.prev_room_y = self.room_y
 
         # 动画
         self.frame_index = 0
@@ -71,7 +76,7 @@ class CatState:
 
     def update_play_time(self):
         """更新游戏时长"""
-        self.play_time += 1 / GameConfig.FPS  # 每帧增加对应的秒数
+        self.play_time += 1 / GameConfig.TICK_RATE  # 每个tick增加对应的秒数
 
     def auto_save_check(self, game_time):
         """检查是否需要自动存档"""
@@ -206,7 +211,7 @@ class CatState:
 
         # 随机选择一个需求
         if weighted_needs:
-            selected = random.choice(weighted_needs)
+            selected = self.rng.choice(weighted_needs)
             self.current_needs.append(selected)
             print(f"选择新需求：{selected}(当前需求数：{len(self.current_needs)}/{GameConfig.MAX_CONCURRENT_NEEDS})")
             return selected
@@ -265,6 +270,13 @@ class CatState:
         else:
             return self.room_x, self.room_y
 
+    def get_render_position(self, scene, alpha=1.0):
+        """渲染用的位置：在上一个tick和当前tick的位置之间按 alpha(0~1) 插值"""
+        if scene.is_main_scene():
+            return self.main_x, self.main_y
+        return (round(self.prev_room_x + (self.room_x - self.prev_room_x) * alpha),
+                round(self.prev_room_y + (self.room_y - self.prev_room_y) * alpha))
+
     def show_no_need_message(self, zone_name):
         """显示无需求消息"""
         self.no_need_message = TextConfig.NO_NEED_TEXTS.get(zone_name, "I don't need this!")
@@ -273,6 +285,7 @@ class CatState:
 
     def update_position(self):
         """更新猫咪位置"""
+        self.prev_room_x, self.prev_room_y = self.room_x, self.room_y
         if not self.is_moving:
             return
 
@@ -367,19 +380,22 @@ class CatState:
 
         return "normal"
 
-    def update(self, cat_animation, scene):
-        """更新所有状态，统一管理 - 每帧都会调用"""
+    def update(self, scene_name):
+        """更新所有状态，统一管理 - 每个tick调用一次
+
+        scene_name: 当前场景名（"main" 或 "room"），只做纯状态计算，不需要动画和窗口
+        """
         self.update_stats_decay()  # 持续的状态值衰减
 
         # 重置临时状态
         self.temp_status = None
         # 每帧都检查抚摸状态
-        if scene.is_main_scene() and "touch" in self.current_needs:
+        if scene_name == "main" and "touch" in self.current_needs:
             if self.touch_system.is_touching:
                 self.temp_status = "touch"
 
         # 只有在room里处理移动和交互
-        if scene.is_room_scene():
+        if scene_name == "room":
             self.update_position()
             # 处理动作完成
             if self.current_action and self.action_timer > 0:
@@ -422,7 +438,7 @@ class CatState:
                     self.status = "normal"
 
         # 处理main中抚摸动作的完成
-        elif scene.is_main_scene():
+        elif scene_name == "main":
             if self.current_action == "touch" and self.action_timer > 0:
                 self.action_timer -= 1
                 if self.action_timer <= 0:
@@ -442,7 +458,7 @@ class CatState:
         # 更新动画状态
         self.status = self.get_current_status_for_animation()
 
-        # 更新动画帧
-        scene_type = "main" if scene.is_main_scene() else "room"
-        current_frames = cat_animation[scene_type][self.status]
-        self.frame_index = (self.frame_index + 1) % len(current_frames)
+    def advance_frame(self, frame_count):
+        """推进动画帧，frame_count 是当前状态动画的帧数"""
+        if frame_count:
+            self.frame_index = (self.frame_index + 1) % frame_count
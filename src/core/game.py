@@ -1,17 +1,24 @@
 # src/core/game.py - 修正版本
 """主游戏类"""
 
+import time
 import pygame
 from src.config.game_config import GameConfig
 from src.core.game_time import GameTime
 from src.core.scene_manager import GameScene
 from src.core.cat_state import CatState
+from src.core.simulation import Simulation
 from src.systems.resource_manager import ResourceManager
 from src.systems.loading_state import LoadingState
+from src.systems.animation_store import AnimationStore
+from src.systems.hot_reload import HotReloader
 from src.events.event_handler import EventHandler
 from src.renderer.ui_renderer import UIRenderer
 from src.renderer.cat_renderer import CatRenderer
 from src.renderer.effect_renderer import EffectRenderer
+from src.renderer.font_registry import FontRegistry
+from src.renderer.surface_pool import SurfacePool
+from src.renderer.render_queue import RenderQueue
 
 
 class Game:
@@ -20,33 +27,64 @@ class Game:
     def __init__(self):
         print("📦 初始化游戏...")
 
-        # 初始化pygame
-        pygame.init()
-
-        # 创建场景管理器
-        self.scene = GameScene()
+        # 初始化pygame，再创建场景和渲染相关状态（离屏渲染器也复用）
+        self._init_pygame()
+        self._init_render_state(GameScene())
 
         # 创建加载状态管理器
         self.loading_state = LoadingState()
 
-        # 游戏状态变量
-        self.game_time = None
-        self.cat_animation = None
-        self.ui_images = None
-        self.cat_state = None
         self.clock = pygame.time.Clock()
         self.running = True
 
         # 事件处理器
         self.event_handler = EventHandler()
 
-        # 资源加载计数器
-        self.loading_timer = 0
+        # 固定步长模拟
+        self.last_frame_time = None  # 上一帧的时间（单调时钟，秒）
+        self.tick_accumulator = 0  # 还没有模拟的时间（秒）
+        self.tick_count = 0  # 已模拟的tick数
 
         # 先加载loading动画
         loading_frames = ResourceManager.load_loading_animation()
         self.loading_state.loading_frames = loading_frames
 
+    @staticmethod
+    def _init_pygame():
+        """初始化pygame模块（不创建窗口）"""
+        pygame.init()
+        # 所有渲染器共享的字体只在启动时创建一次
+        FontRegistry.preload()
+
+    def _init_render_state(self, scene):
+        """初始化渲染一帧游戏画面需要的全部状态（_render_game 及签名计算读取的属性都在这里）
+
+        scene: 场景管理器（游戏窗口为 GameScene，离屏渲染为 OffscreenScene）
+        """
+        self.scene = scene
+
+        # 游戏状态变量
+        self.game_time = None
+        self.cat_animation = None
+        self.ui_images = None
+        self.ui_images_converted = False  # UI图片是否已是显示格式（无头模式加载的等有窗口后再转换）
+        self.cat_state = None
+        self.simulation = None
+        self.hot_reloader = None
+
+        # 脏矩形渲染状态
+        self.dirty_rects = None  # 本帧需要更新到屏幕的区域（None表示整个窗口）
+        self.drawn_rects = None  # 上一帧画在背景上的区域
+        self.drawn_generation = None  # 上一帧绘制时的窗口版本（窗口重建后需要整体重画）
+        self.drawn_layer = None  # 上一帧使用的静态UI层（静态层重建后需要整体重画）
+
+        # 渲染器把绘制命令放进队列，每帧统一提交
+        self.render_queue = RenderQueue()
+
+        # 跳过未变化的帧
+        self.last_signature = None  # 上一次渲染时的画面签名
+        self.skipped_frames = 0  # 因画面没有变化而跳过渲染的帧数
+
     def run(self):
         """游戏主循环"""
         print("🎮 游戏开始运行...")
@@ -60,8 +98,12 @@ class Game:
             # 更新场景过渡
             self.scene.update_transition()
             # 更新显示
-            pygame.display.flip()
-            self.clock.tick(GameConfig.FPS)
+            if self.dirty_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(self.scene.to_display_rects(self.dirty_rects))
+            # 加载界面的动画和过渡按tick计数，游戏场景按渲染帧率刷新
+            self.clock.tick(GameConfig.TICK_RATE if self.scene.is_loading_scene() else GameConfig.FPS)
 
         pygame.quit()
         print("游戏结束，感谢游玩")
@@ -74,38 +116,63 @@ class Game:
                 self.running = False
 
         self.loading_state.update()
-        self.loading_timer += 1
-
-        # 模拟加载过程并实际加载资源
-        if self.loading_timer > 180:  # 3秒后开始加载资源
-            if self.game_time is None:
-                print("🔄 加载游戏资源...")
-                self.game_time = GameTime()
-                self.cat_animation = ResourceManager.load_all_animations()
-                self.ui_images = ResourceManager.load_ui_images()
-
-                if self.cat_animation and self.ui_images:
-                    self.cat_state = CatState(self.game_time)
-                    self.loading_state.is_loading_complete = True
-                    print("✅ 资源加载完成，开始过渡到主界面")
-                    self.scene.start_transition_to_main()
-                else:
-                    print("❌ 资源加载失败，游戏退出")
-                    self.running = False
+
+        # 每帧在时间预算内推进资源加载，加载动画保持播放
+        if self.game_time is None and self.loading_state.pipeline is None:
+            print("🔄 加载游戏资源...")
+            self.game_time = GameTime()
+            self.loading_state.start(self._iter_load_resources())
+
+        if self.cat_state is None and self.loading_state.advance():
+            self.cat_animation, self.ui_images = self.loading_state.result
+            self.ui_images_converted = ResourceManager.has_display()
+            if self.cat_animation and self.ui_images:
+                self.cat_state = CatState(self.game_time)
+                self.simulation = Simulation(self.game_time, self.cat_state, frame_counts=self._get_frame_count,
+                                             autosave=True)
+                if GameConfig.HOT_RELOAD:
+                    self.hot_reloader = HotReloader(self.cat_animation)
+                print("✅ 资源加载完成，开始过渡到主界面")
+                self.scene.start_transition_to_main()
+            else:
+                print("❌ 资源加载失败，游戏退出")
+                self.running = False
 
         # 绘制加载界面
-        EffectRenderer.draw_loading_screen(self.scene.window, self.loading_state, self.loading_timer)
+        EffectRenderer.draw_loading_screen(self.scene.window, self.loading_state)
 
         # 如果正在过渡，添加淡出效果
         if self.scene.is_transitioning:
             alpha = self.scene.get_transition_alpha()
-            fade_surface = pygame.Surface(GameConfig.LOADING_WINDOW_SIZE)
-            fade_surface.set_alpha(255 - alpha)
-            fade_surface.fill((0, 0, 0))
-            self.scene.window.blit(fade_surface, (0, 0))
+            with SurfacePool.borrowed(GameConfig.LOADING_WINDOW_SIZE) as fade_surface:
+                fade_surface.set_alpha(255 - alpha)
+                fade_surface.fill((0, 0, 0))
+                self.scene.window.blit(fade_surface, (0, 0))
+
+    def _iter_load_resources(self):
+        """资源加载流水线：动画占前80%进度，UI图片占后20%，结束时返回 (动画, UI图片)"""
+        cat_animation = yield from LoadingState.scale_progress(self._iter_load_animations(), 0, 0.8)
+        if not cat_animation:
+            return None, None
+        ui_images = yield from LoadingState.scale_progress(ResourceManager.iter_load_ui_images(), 0.8, 1.0)
+        return cat_animation, ui_images
+
+    def _iter_load_animations(self):
+        """创建动画仓库：按需加载时只预载normal动画，否则一次性加载全部动画"""
+        if GameConfig.LAZY_ANIMATION_LOADING:
+            store = AnimationStore()
+            for done_count, scene_type in enumerate(GameConfig.CAT_SCENE_SIZES):
+                if not store.preload([scene_type], AnimationStore.PINNED_STATES):
+                    print("❌ 关键错误：无法加载normal动画，游戏无法启动")
+                    return None
+                yield (done_count + 1) / len(GameConfig.CAT_SCENE_SIZES)
+            return store
+
+        animations = yield from ResourceManager.iter_load_all_animations()
+        return AnimationStore.from_animations(animations) if animations else None
 
     def _handle_game_scene(self):
-        """处理游戏场景"""
+        """处理游戏场景：事件每帧处理，游戏状态按固定频率更新，画面按渲染帧率插值绘制"""
         # 只有在cat_state存在时才处理游戏逻辑
         if self.cat_state is None:
             self.running = False
@@ -118,33 +185,140 @@ class Game:
         if not self.running:
             return
 
-        # 更新游戏时间
-        self.game_time.update()
-        # 更新游戏状态
-        self.cat_state.update(self.cat_animation, self.scene)
-        # 更新存档相关状态
-        self.cat_state.update_play_time()
-        self.cat_state.update_save_message()
-        self.cat_state.auto_save_check(self.game_time)
+        # 按真实经过的时间补算固定步长的tick（卡顿时最多补 MAX_TICKS_PER_FRAME 个）
+        tick_seconds = 1 / GameConfig.TICK_RATE
+        now = time.perf_counter()
+        if self.last_frame_time is None:
+            self.tick_accumulator = tick_seconds  # 第一帧立即更新一次
+        else:
+            self.tick_accumulator += now - self.last_frame_time
+        self.last_frame_time = now
+
+        ticks = 0
+        while self.tick_accumulator >= tick_seconds and ticks < GameConfig.MAX_TICKS_PER_FRAME:
+            self._simulate_tick()
+            self.tick_accumulator -= tick_seconds
+            ticks += 1
+        if ticks == GameConfig.MAX_TICKS_PER_FRAME:
+            self.tick_accumulator = min(self.tick_accumulator, tick_seconds)
+        self.tick_count += ticks
+
+        # 窗口被遮挡后重新露出时必须重画
+        if any(event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) for event in events):
+            self.last_signature = None
+
+        # 绘制游戏界面（画面没有变化时跳过渲染和刷新）
+        alpha = min(self.tick_accumulator / tick_seconds, 1.0)
+        signature = self._get_visible_signature(alpha) if GameConfig.SKIP_UNCHANGED_FRAMES else None
+        if signature is not None and signature == self.last_signature:
+            self.skipped_frames += 1
+            self.dirty_rects = []
+        else:
+            self.dirty_rects = self._render_game(alpha)
+            self.last_signature = signature
+
+    def _simulate_tick(self):
+        """按固定步长更新一次游戏状态"""
+        # 更新游戏时间、猫咪状态和存档计时
+        self.simulation.tick(self.scene.current_scene)
+
+        # 开发模式下在tick之间替换修改过的动画帧
+        if self.hot_reloader:
+            self.hot_reloader.poll()
 
-        # 绘制游戏界面
-        self._render_game()
+    def _get_frame_count(self, scene_type, status):
+        """当前动画的帧数（模拟推进帧序号时使用）"""
+        return len(self.cat_animation.get_frames(scene_type, status))
+
+    def _get_current_cat_frame(self):
+        """当前要画的猫咪帧表面（停顿帧是同一个表面，签名里比较表面本身而不是帧序号）"""
+        scene_type = "main" if self.scene.is_main_scene() else "room"
+        frames = self.cat_animation.get_frames(scene_type, self.cat_state.status)
+        return frames[self.cat_state.frame_index] if frames else None
+
+    def _get_visible_signature(self, alpha=1.0):
+        """画面签名：包含所有会影响画面的状态，签名不变说明画面和上一次渲染完全相同"""
+        cat_state = self.cat_state
+        touch_progress = None
+        if self.scene.is_main_scene() and "touch" in cat_state.current_needs:
+            touch_progress = UIRenderer.get_touch_display(cat_state.touch_system.touch_progress)
+        save_message = cat_state.last_save_message if cat_state.save_message_timer > 0 else None
+        return (
+            self.scene.current_scene, self.scene.window_generation,
+            self._get_current_cat_frame(), cat_state.get_render_position(self.scene, alpha),
+            UIRenderer.get_bar_signature(cat_state.health), UIRenderer.get_bar_signature(cat_state.mood),
+            self.game_time.get_time_string(), self.game_time.is_daytime(), self.game_time.is_sleeping,
+            int(cat_state.play_time), save_message, EffectRenderer.get_cloud_text(cat_state), touch_progress,
+            self.hot_reloader.reload_count if self.hot_reloader else 0
+        )
+
+    def _convert_ui_images(self):
+        """有显示模式后把无头模式加载的UI图片原地转换成显示格式（只转换一次）"""
+        if not self.ui_images_converted and ResourceManager.has_display():
+            ResourceManager.convert_resources(self.ui_images)
+            self.ui_images_converted = True
+
+    def _render_game(self, alpha=1.0):
+        """渲染游戏界面，返回需要更新到屏幕的区域（None表示整个窗口）
+
+        alpha: 距上一个tick经过的时间占一个tick的比例，用于插值猫咪位置
+
+        脏矩形模式下只在上一帧画过的区域和需要重画的静态UI下恢复背景，返回这些区域和本帧绘制区域的并集
+        """
+        window = self.scene.window
+        queue = self.render_queue
+        queue.begin(window)
+        self._convert_ui_images()
+        background = UIRenderer.get_background(self.ui_images, self.scene)
+        # 不变的UI已预先画到静态层，每帧按区域贴回
+        static_layer, static_rects = UIRenderer.get_static_layer(self.ui_images, self.scene)
+        full_redraw = (not GameConfig.DIRTY_RECT_RENDERING or self.drawn_rects is None
+                       or self.scene.window_generation != self.drawn_generation
+                       or static_layer is not self.drawn_layer)
 
-    def _render_game(self):
-        """渲染游戏界面"""
         # 绘制背景
-        bg_name = "main_background" if self.scene.is_main_scene() else "room_background"
-        self.scene.window.blit(self.ui_images[bg_name], (0, 0))
+        with queue.layer(RenderQueue.LAYER_BACKGROUND):
+            if full_redraw:
+                queue.blit(background, (0, 0))
+            else:
+                for rect in self.drawn_rects:
+                    queue.blit(background, rect, rect)
 
         # 绘制猫咪
-        CatRenderer.draw_cat(self.scene.window, self.cat_animation, self.cat_state, self.scene)
+        with queue.layer(RenderQueue.LAYER_CAT):
+            rects = CatRenderer.draw_cat(queue, self.cat_animation, self.cat_state, self.scene, alpha)
+
+        # 静态UI盖在猫咪上面。脏矩形模式下，和上一帧绘制区域或本帧猫咪相交的静态UI整块恢复背景后重画，
+        # 避免半透明的文字边缘在同一位置叠加两次
+        if full_redraw:
+            static_areas = static_rects
+        else:
+            static_areas = [rect for rect in static_rects if rect.collidelist(self.drawn_rects + rects) != -1]
+            with queue.layer(RenderQueue.LAYER_BACKGROUND):
+                for rect in static_areas:
+                    queue.blit(background, rect, rect)
 
         # 绘制UI元素
-        UIRenderer.draw_fixed_ui(self.scene.window, self.ui_images, self.cat_state, self.scene)
-        UIRenderer.draw_buttons(self.scene.window, self.ui_images, self.scene)
-        UIRenderer.draw_time_display(self.scene.window, self.game_time)
-        UIRenderer.draw_game_info(self.scene.window, self.cat_state)
-        UIRenderer.draw_save_message(self.scene.window, self.cat_state)
+        with queue.layer(RenderQueue.LAYER_UI):
+            for rect in static_areas:
+                queue.blit(static_layer, rect, rect)
+            rects += UIRenderer.draw_fixed_ui(queue, self.ui_images, self.cat_state, self.scene)
+            rects += UIRenderer.draw_time_display(queue, self.game_time)
+            rects += UIRenderer.draw_game_info(queue, self.cat_state)
 
         # 绘制特效
-        EffectRenderer.draw_need_clouds(self.scene.window, self.ui_images["cloud"], self.cat_state, self.scene)
+        with queue.layer(RenderQueue.LAYER_EFFECT):
+            rects += EffectRenderer.draw_need_clouds(queue, self.ui_images["cloud"], self.cat_state, self.scene,
+                                                     alpha=alpha)
+
+        # 存档提示画在最上层
+        with queue.layer(RenderQueue.LAYER_OVERLAY):
+            rects += UIRenderer.draw_save_message(queue, self.cat_state)
+
+        queue.flush()
+
+        dirty_rects = None if full_redraw else self.drawn_rects + static_areas + rects
+        self.drawn_rects = rects
+        self.drawn_generation = self.scene.window_generation
+        self.drawn_layer = static_layer
+        return dirty_rects
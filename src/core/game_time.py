@@ -16,7 +16,7 @@ class GameTime:
     def update(self):
         """更新游戏时间"""
         self.frame_counter += self.time_speed_multiplier
-        frames_per_hour = GameConfig.GAME_HOUR_DURATION * GameConfig.FPS
+        frames_per_hour = GameConfig.GAME_HOUR_DURATION * GameConfig.TICK_RATE
 
         if self.frame_counter >= frames_per_hour:
             self.frame_counter = 0
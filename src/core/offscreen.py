@@ -0,0 +1,54 @@
+# src/core/offscreen.py
+"""离屏渲染 - 不创建窗口，把任意游戏状态渲染成像素数组"""
+
+from src.core.game import Game
+from src.core.scene_manager import OffscreenScene
+from src.systems.resource_manager import ResourceManager
+from src.systems.animation_store import AnimationStore
+
+
+class OffscreenRenderer(Game):
+    """离屏渲染器：复用 Game._render_game 和所有渲染器，画到普通表面上
+
+    不调用 pygame.display，可在无头渲染节点上批量生成缩略图或做画面检查。
+    像素数组通过 pygame.surfarray 返回，需要安装 numpy。
+    """
+
+    def __init__(self, cat_animation=None, ui_images=None, scene_name="main"):
+        # 和 Game 共用同一套初始化，只是场景画在普通表面上，不创建窗口
+        self._init_pygame()
+        self._init_render_state(OffscreenScene(scene_name))
+
+        self.cat_animation = cat_animation or AnimationStore()
+        # 传入的图片可能是无头模式加载的，保守起见有显示模式后再转换一次
+        self.ui_images_converted = ui_images is None and ResourceManager.has_display()
+        self.ui_images = ui_images or ResourceManager.load_ui_images()
+        if self.ui_images is None:
+            raise RuntimeError("UI图片加载失败，无法离屏渲染")
+        self.frames_rendered = 0
+
+    def render_surface(self, cat_state, game_time, scene_name=None, alpha=1.0):
+        """把游戏状态渲染到离屏表面并返回该表面（下一次渲染会覆盖）"""
+        if scene_name:
+            self.scene.set_scene(scene_name)
+        self.cat_state = cat_state
+        self.game_time = game_time
+        # 每次都整体重画，结果只取决于传入的状态
+        self.drawn_rects = None
+        self._render_game(alpha)
+        self.frames_rendered += 1
+        return self.scene.window
+
+    def render(self, cat_state, game_time, scene_name=None, alpha=1.0):
+        """渲染游戏状态，返回形状为 (高, 宽, 3) 的 uint8 像素数组"""
+        try:
+            import numpy
+            from pygame import surfarray
+        except ImportError as e:
+            raise ImportError("离屏渲染返回像素数组需要 numpy：pip install numpy") from e
+        surface = self.render_surface(cat_state, game_time, scene_name, alpha)
+        # 直接引用表面像素再复制成按行存储的数组，比 array3d 少一次转换
+        view = surfarray.pixels3d(surface)
+        pixels = numpy.ascontiguousarray(view.swapaxes(0, 1))
+        del view  # 释放表面锁
+        return pixels
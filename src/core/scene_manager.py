@@ -12,7 +12,10 @@ class GameScene:
     def __init__(self):
         self.current_scene = "loading"
         self.target_scene = "loading"
-        self.window = None
+        self.window = None  # 当前场景的绘制表面（常驻窗口模式下是显示表面中视口的子表面）
+        self.display = None  # 显示表面
+        self.viewport = None  # 当前场景在显示表面中的区域
+        self.window_generation = 0  # 场景窗口切换次数（set_mode可能复用同一个表面对象，渲染时据此判断是否要整体重画）
         self.transition_timer = 0
         self.is_transitioning = False
         self.create_window()
@@ -43,18 +46,53 @@ class GameScene:
         progress = self.transition_timer / GameConfig.TRANSITION_DURATION
         return int(255 * progress)
 
-    def create_window(self):
-        """根据当前场景创建窗口"""
+    def get_window_size(self):
+        """当前场景的窗口尺寸"""
         if self.current_scene == "loading":
-            size = GameConfig.LOADING_WINDOW_SIZE
+            return GameConfig.LOADING_WINDOW_SIZE
         elif self.current_scene == "main":
-            size = GameConfig.MAIN_WINDOW_SIZE
+            return GameConfig.MAIN_WINDOW_SIZE
         else:
-            size = GameConfig.ROOM_WINDOW_SIZE
+            return GameConfig.ROOM_WINDOW_SIZE
+
+    @staticmethod
+    def get_display_size():
+        """常驻窗口的尺寸：能放下所有场景"""
+        sizes = (GameConfig.LOADING_WINDOW_SIZE, GameConfig.MAIN_WINDOW_SIZE, GameConfig.ROOM_WINDOW_SIZE)
+        return max(w for w, _ in sizes), max(h for _, h in sizes)
+
+    def create_window(self):
+        """根据当前场景创建窗口
 
-        self.window = pygame.display.set_mode(size)
+        常驻窗口模式下只在第一次调用 set_mode，之后切换场景只是换一个居中的视口子表面，
+        不会销毁显示表面，已转换成显示格式的表面也一直有效。
+        """
+        size = self.get_window_size()
+        if not GameConfig.PERSISTENT_WINDOW:
+            self.display = pygame.display.set_mode(size)
+            self.viewport = self.display.get_rect()
+            self.window = self.display
+        else:
+            if self.display is None:
+                self.display = pygame.display.set_mode(self.get_display_size())
+            self.viewport = pygame.Rect((0, 0), size)
+            self.viewport.center = self.display.get_rect().center
+            # 视口以外的区域填成底色，切换后的第一帧会整体刷新
+            self.display.fill(GameConfig.VIEWPORT_BACKGROUND_COLOR)
+            self.window = self.display.subsurface(self.viewport)
+        self.window_generation += 1
         pygame.display.set_caption(TextConfig.WINDOW_TITLE)
 
+    def to_scene_pos(self, pos):
+        """把窗口中的鼠标坐标换算成当前场景中的坐标"""
+        return pos[0] - self.viewport.x, pos[1] - self.viewport.y
+
+    def to_display_rects(self, rects):
+        """把场景中的脏矩形换算成显示表面上的区域"""
+        if not self.viewport.topleft:
+            return rects
+        return [rect.move(self.viewport.topleft) for rect in rects]
+
     def switch_to_main(self):
         self.current_scene = "main"
         self.create_window()
@@ -71,3 +109,26 @@ class GameScene:
 
     def is_room_scene(self):
         return self.current_scene == "room"
+
+
+class OffscreenScene(GameScene):
+    """离屏场景：接口和 GameScene 相同，但窗口是普通表面，不需要显示模式"""
+
+    def __init__(self, scene_name="main"):
+        super().__init__()
+        self.set_scene(scene_name)
+
+    def create_window(self):
+        """尺寸变化时才重新创建离屏表面"""
+        size = self.get_window_size()
+        if self.window is None or self.window.get_size() != size:
+            self.window = pygame.Surface(size)
+            self.display = self.window
+            self.viewport = self.window.get_rect()
+        self.window_generation += 1
+
+    def set_scene(self, scene_name):
+        """直接切换到指定场景（没有过渡动画）"""
+        if scene_name != self.current_scene:
+            self.current_scene = self.target_scene = scene_name
+            self.create_window()
@@ -0,0 +1,83 @@
+# src/core/simulation.py
+"""模拟核心 - 不依赖pygame，按tick推进猫咪和游戏时间"""
+
+import contextlib
+from src.config.game_config import GameConfig
+from src.config.animation_config import AnimationConfig
+from src.core.game_time import GameTime
+from src.core.cat_state import CatState
+
+
+class Simulation:
+    """纯模拟核心：推进 GameTime、CatState（需求、抚摸、移动、存档计时），不接触窗口和动画表面
+
+    游戏主循环每个tick调用一次 tick()；测试和数值调整时可以不限速地连续运行，
+    几毫秒内模拟宠物好几天的生活。
+    """
+
+    def __init__(self, game_time=None, cat_state=None, frame_counts=None, autosave=False):
+        self.game_time = game_time or GameTime()
+        self.cat_state = cat_state or CatState(self.game_time)
+        # 取当前动画帧数的函数 (场景类型, 状态) -> 帧数，默认按动画配置中的帧数
+        self.frame_counts = frame_counts or Simulation.get_config_frame_count
+        self.autosave = autosave  # 只有游戏主循环需要自动存档，测试和批量模拟默认不写存档
+
+        # 统计信息
+        self.tick_count = 0
+        self.min_health = self.cat_state.health
+        self.min_mood = self.cat_state.mood
+
+    @staticmethod
+    def get_config_frame_count(scene_type, status):
+        """动画配置中的帧数（不需要加载动画）"""
+        config = AnimationConfig.ANIMATION.get(status, AnimationConfig.ANIMATION["normal"])
+        return config["count"]
+
+    @staticmethod
+    def ticks_for(days=0, hours=0):
+        """游戏内时长对应的tick数（不睡觉时）"""
+        return int((days * 24 + hours) * GameConfig.GAME_HOUR_DURATION * GameConfig.TICK_RATE)
+
+    def tick(self, scene_name="main"):
+        """推进一个tick"""
+        cat_state = self.cat_state
+        self.game_time.update()
+        cat_state.update(scene_name)
+        cat_state.advance_frame(self.frame_counts(scene_name, cat_state.status))
+
+        # 存档相关状态
+        cat_state.update_play_time()
+        cat_state.update_save_message()
+        if self.autosave:
+            cat_state.auto_save_check(self.game_time)
+
+        self.tick_count += 1
+        self.min_health = min(self.min_health, cat_state.health)
+        self.min_mood = min(self.min_mood, cat_state.mood)
+
+    def run(self, ticks, scene_name="main", quiet=True, seed=None):
+        """不限速地连续模拟 ticks 个tick
+
+        quiet: 屏蔽模拟过程中的打印输出；seed: 随机种子，用于复现需求生成（只重置这只猫的随机数生成器）
+        """
+        if seed is not None:
+            self.cat_state.rng.seed(seed)
+        output = contextlib.redirect_stdout(None) if quiet else contextlib.nullcontext()
+        with output:
+            for _ in range(ticks):
+                self.tick(scene_name)
+        return self
+
+    def get_stats(self):
+        """获取模拟统计信息"""
+        cat_state = self.cat_state
+        return {
+            "ticks": self.tick_count,
+            "game_hour": self.game_time.current_hour,
+            "play_time": cat_state.play_time,
+            "health": cat_state.health,
+            "mood": cat_state.mood,
+            "min_health": self.min_health,
+            "min_mood": self.min_mood,
+            "current_needs": list(cat_state.current_needs)
+        }
@@ -52,7 +52,7 @@ class EventHandler:
     def _handle_mouse_button_down(self, event, cat_state, scene):
         """处理鼠标按下事件"""
         if event.button == 1:  # 左键按下
-            mouse_x, mouse_y = event.pos
+            mouse_x, mouse_y = scene.to_scene_pos(event.pos)
 
             # 在主场景检查是否点击猫咪附近
             if scene.is_main_scene():
@@ -64,10 +64,10 @@ class EventHandler:
                     cat_state.touch_system.start_touch(mouse_x)
                 else:
                     # 处理其他点击（如按钮）
-                    self._handle_click(event.pos, cat_state, scene)
+                    self._handle_click((mouse_x, mouse_y), cat_state, scene)
             else:
                 # 房间场景的正常点击处理
-                self._handle_click(event.pos, cat_state, scene)
+                self._handle_click((mouse_x, mouse_y), cat_state, scene)
 
     def _handle_mouse_button_up(self, event, cat_state):
         """处理鼠标释放事件"""
@@ -77,7 +77,7 @@ class EventHandler:
 
     def _handle_mouse_motion(self, event, cat_state, scene):
         """处理鼠标移动事件"""
-        mouse_x, mouse_y = event.pos
+        mouse_x, mouse_y = scene.to_scene_pos(event.pos)
 
         # 检查鼠标是否在猫咪附近
         if scene.is_main_scene() and "touch" in cat_state.current_needs:
@@ -28,8 +28,9 @@ def find_project_root():
 
     for root in possible_roots:
         assets_dir = root / "assets"
+        pack_file = root / "assets.pak"  # 发布时可以只带资源包
         src_dir = root / "src"
-        if assets_dir.exists() and src_dir.exists():
+        if (assets_dir.exists() or pack_file.exists()) and src_dir.exists():
             print(f"✅ 找到项目根目录: {root}")
             return root.resolve()
 
@@ -79,12 +80,21 @@ loading_dir = assets_dir / "animations" / "loading"
 print(f"📁 Assets目录: {assets_dir}")
 print(f"📁 Loading目录: {loading_dir}")
 
-if not assets_dir.exists():
+from src.systems.asset_manifest import AssetManifest
+from src.systems.asset_pack import AssetPack
+
+pack = AssetPack.get()
+if not pack and not assets_dir.exists():
     print(f"❌ 资源文件夹不存在: {assets_dir}")
     sys.exit(1)
 
-if loading_dir.exists():
-    loading_files = list(loading_dir.glob("load_frame_*.png"))
+# 使用资源包时查包索引，有资源清单时直接查清单，都不扫描目录
+asset_index = pack or AssetManifest.get()
+if asset_index or loading_dir.exists():
+    if asset_index:
+        loading_files = asset_index.list_files("assets/animations/loading", "load_frame_", ".png")
+    else:
+        loading_files = list(loading_dir.glob("load_frame_*.png"))
     print(f"📄 找到 {len(loading_files)} 个loading动画文件")
     if len(loading_files) >= 12:
         print("✅ Loading动画文件充足")
@@ -4,5 +4,9 @@
 from .ui_renderer import UIRenderer
 from .cat_renderer import CatRenderer
 from .effect_renderer import EffectRenderer
+from .font_registry import FontRegistry
+from .text_cache import TextCache
+from .surface_pool import SurfacePool
+from .render_queue import RenderQueue
 
-__all__ = ['UIRenderer', 'CatRenderer', 'EffectRenderer']
\ No newline at end of file
+__all__ = ['UIRenderer', 'CatRenderer', 'EffectRenderer', 'FontRegistry', 'TextCache', 'SurfacePool', 'RenderQueue']
\ No newline at end of file
@@ -2,16 +2,23 @@
 """特效渲染器"""
 
 import pygame
+from collections import OrderedDict
 from src.config.game_config import GameConfig
 from src.config.ui_layout import UILayout
 from src.config.text_config import TextConfig
+from src.renderer.font_registry import FontRegistry
+from src.renderer.text_cache import TextCache
+from src.renderer.nine_slice import NineSlice
 
 
 class EffectRenderer:
     """特效渲染器"""
+    _cloud_source = None  # 切片所用的云朵原图
+    _cloud_slices = None  # 云朵九宫格切片
+    _cloud_cache = OrderedDict()  # {文字: 带文字的云朵表面}，最近使用的在后
 
     @staticmethod
-    def draw_loading_screen(window, loading_state, loading_timer):
+    def draw_loading_screen(window, loading_state):
         """绘制加载界面"""
         window.fill(GameConfig.LOADING_BACKGROUND_COLOR)
 
@@ -30,8 +37,8 @@ class EffectRenderer:
             window.blit(current_frame, (cat_x, cat_y))
 
         # 绘制"Loading..."文字
-        font = pygame.font.SysFont(UILayout.FONT_NAME, 24, bold=True)
-        text_surface = font.render(GameConfig.LOADING_TEXT, True, GameConfig.LOADING_TEXT_COLOR)
+        font = FontRegistry.get(UILayout.FONT_SIZE_LOADING, bold=True)
+        text_surface = TextCache.render(font, GameConfig.LOADING_TEXT, GameConfig.LOADING_TEXT_COLOR)
         text_rect = text_surface.get_rect()
         text_x = center_x - text_rect.width // 2
         text_y = center_y + 50  # 在猫咪下方
@@ -39,12 +46,12 @@ class EffectRenderer:
 
         # 绘制加载进度点点
         dots = "." * ((loading_state.frame_index // 4) % 4)  # 0到3个点循环
-        dots_surface = font.render(dots, True, GameConfig.LOADING_TEXT_COLOR)
+        dots_surface = TextCache.render(font, dots, GameConfig.LOADING_TEXT_COLOR)
         dots_x = text_x + text_rect.width + 5
         window.blit(dots_surface, (dots_x, text_y))
 
         # 绘制进度条
-        progress = min(100, (loading_timer / 180) * 100)  # 基于计时器的进度
+        progress = min(100, loading_state.progress * 100)  # 真实的资源加载进度
         bar_width = 200
         bar_height = 8
         bar_x = center_x - bar_width // 2
@@ -58,24 +65,22 @@ class EffectRenderer:
             pygame.draw.rect(window, GameConfig.LOADING_TEXT_COLOR, (bar_x, bar_y, fill_width, bar_height))
 
         # 进度百分比
-        progress_font = pygame.font.SysFont(UILayout.FONT_NAME, 16)
+        progress_font = FontRegistry.get(UILayout.FONT_SIZE_LOADING_PROGRESS)
         progress_text = f"{progress:.0f}%"
-        progress_surface = progress_font.render(progress_text, True, GameConfig.LOADING_TEXT_COLOR)
+        progress_surface = TextCache.render(progress_font, progress_text, GameConfig.LOADING_TEXT_COLOR)
         progress_rect = progress_surface.get_rect()
         window.blit(progress_surface, (center_x - progress_rect.width // 2, bar_y + 15))
 
     @staticmethod
-    def draw_need_clouds(window, cloud_img, cat_state, scene, mode="all"):
-        """绘制所有云朵"""
+    def get_cloud_text(cat_state):
+        """当前云朵要显示的文字，没有云朵时返回None"""
         # 优先检查是否有无需求消息要显示
         if cat_state.no_need_message and cat_state.no_need_timer > 0:
-            text = cat_state.no_need_message
-            EffectRenderer.draw_single_cloud(window, cloud_img, text, cat_state, scene)
-            return
+            return cat_state.no_need_message
 
         # 显示所有活跃需求
         if not cat_state.current_needs:
-            return
+            return None
 
         # 简单实现：轮流显示不同的需求
         # 可以根据帧数决定显示哪个需求
@@ -85,28 +90,58 @@ class EffectRenderer:
         # 在需求文本后添加数量提示
         if len(cat_state.current_needs) > 1:
             text += f"({display_index + 1}/{len(cat_state.current_needs)})"
-        EffectRenderer.draw_single_cloud(window, cloud_img, text, cat_state, scene)
+        return text
 
     @staticmethod
-    def draw_single_cloud(window, cloud_img, text, cat_state, scene):
-        """绘制单个云朵"""
-        font = pygame.font.SysFont(UILayout.FONT_NAME, UILayout.FONT_SIZE_CLOUD, bold=True)
-        text_surface = font.render(text, True, UILayout.FONT_COLOR)
+    def draw_need_clouds(window, cloud_img, cat_state, scene, mode="all", alpha=1.0):
+        """绘制所有云朵，返回绘制区域列表"""
+        text = EffectRenderer.get_cloud_text(cat_state)
+        if text is None:
+            return []
+        return [EffectRenderer.draw_single_cloud(window, cloud_img, text, cat_state, scene, alpha)]
+
+    @staticmethod
+    def get_cloud_surface(cloud_img, text):
+        """获取带文字的云朵（按文字缓存，只有第一次出现的文字才拼接九宫格和缩放）"""
+        cache = EffectRenderer._cloud_cache
+        if EffectRenderer._cloud_source is not cloud_img:
+            # 换了云朵图片（例如重新加载UI）时重新切片
+            EffectRenderer._cloud_slices = NineSlice.from_scaled(
+                cloud_img, GameConfig.CLOUD_HEIGHT, GameConfig.CLOUD_SLICE_INSETS)
+            EffectRenderer._cloud_source = cloud_img
+            cache.clear()
+
+        surface = cache.get(text)
+        if surface is not None:
+            cache.move_to_end(text)
+            return surface
+
+        font = FontRegistry.get(UILayout.FONT_SIZE_CLOUD, bold=True)
+        text_surface = TextCache.render(font, text, UILayout.FONT_COLOR)
         text_width = text_surface.get_width()
 
         # 计算云朵大小
         cloud_width = max(GameConfig.CLOUD_MIN_WIDTH,
                           min(GameConfig.CLOUD_MAX_WIDTH, text_width + GameConfig.CLOUD_PADDING))
-        x, y = cat_state.get_current_position(scene)
+        surface = EffectRenderer._cloud_slices.render((cloud_width, GameConfig.CLOUD_HEIGHT))
+
+        # 绘制文字
+        text_x = (cloud_width - text_width) // 2
+        text_y = (GameConfig.CLOUD_HEIGHT - text_surface.get_height()) // 2
+        surface.blit(text_surface, (text_x, text_y))
+
+        cache[text] = surface
+        while len(cache) > GameConfig.CLOUD_CACHE_SIZE:
+            cache.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def draw_single_cloud(window, cloud_img, text, cat_state, scene, alpha=1.0):
+        """绘制单个云朵，返回绘制区域"""
+        cloud = EffectRenderer.get_cloud_surface(cloud_img, text)
+        cloud_width = cloud.get_width()
+        x, y = cat_state.get_render_position(scene, alpha)
         screen_width = GameConfig.MAIN_WINDOW_SIZE[0] if scene.is_main_scene() else GameConfig.ROOM_WINDOW_SIZE[0]
         cloud_x = max(10, min(screen_width - cloud_width - 10, x - cloud_width // 2))
         cloud_y = y + GameConfig.CLOUD_OFFSET_Y
-
-        # 绘制云朵
-        cloud_scaled = pygame.transform.smoothscale(cloud_img, (cloud_width, GameConfig.CLOUD_HEIGHT))
-        window.blit(cloud_scaled, (cloud_x, cloud_y))
-
-        # 绘制文字
-        text_x = cloud_x + (cloud_width - text_width) // 2
-        text_y = cloud_y + (GameConfig.CLOUD_HEIGHT - text_surface.get_height()) // 2
-        window.blit(text_surface, (text_x, text_y))
+        return window.blit(cloud, (cloud_x, cloud_y))
@@ -0,0 +1,34 @@
+# src/renderer/font_registry.py
+"""字体注册表 - 所有渲染器共享的字体对象"""
+
+import pygame
+from src.config.ui_layout import UILayout
+
+
+class FontRegistry:
+    """按 (字体名, 字号, 粗体, 斜体) 缓存字体，启动时创建一次，绘制时不再构造Font"""
+    _fonts = {}
+    created_count = 0  # 创建过的Font对象总数
+
+    @staticmethod
+    def get(size, bold=False, italic=False, name=UILayout.FONT_NAME):
+        """获取字体，第一次使用时创建"""
+        key = (name, size, bold, italic)
+        font = FontRegistry._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+            FontRegistry._fonts[key] = font
+            FontRegistry.created_count += 1
+        return font
+
+    @staticmethod
+    def preload():
+        """创建 UILayout.FONT_STYLES 中的所有字体"""
+        for size, bold in UILayout.FONT_STYLES:
+            FontRegistry.get(size, bold=bold)
+        print(f"✅ 字体加载完成：{FontRegistry.created_count}个")
+
+    @staticmethod
+    def get_stats():
+        """获取字体统计信息"""
+        return {"fonts": len(FontRegistry._fonts), "created": FontRegistry.created_count}
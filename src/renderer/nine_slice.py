@@ -0,0 +1,52 @@
+# src/renderer/nine_slice.py
+"""九宫格图片 - 拉伸时保持四角不变形"""
+
+import pygame
+
+
+class NineSlice:
+    """把图片按四边内距切成九块：四角原样绘制，上下边只横向拉伸，左右边只纵向拉伸，中心两向拉伸
+
+    九块切片在创建时复制好，render 只缩放边和中心
+    """
+
+    def __init__(self, image, insets):
+        self.image = image
+        self.insets = insets  # (左, 上, 右, 下)，单位为图片像素
+        width, height = image.get_size()
+        left, top, right, bottom = insets
+        xs = (0, left, width - right, width)
+        ys = (0, top, height - bottom, height)
+        self.pieces = [[image.subsurface((xs[col], ys[row], xs[col + 1] - xs[col], ys[row + 1] - ys[row])).copy()
+                        for col in range(3)] for row in range(3)]
+
+    @classmethod
+    def from_scaled(cls, image, height, insets):
+        """先把图片等比例缩放到指定高度（只做一次平滑缩放），再按缩放后的内距切片"""
+        scale = height / image.get_height()
+        scaled = pygame.transform.smoothscale(image, (max(1, round(image.get_width() * scale)), height))
+        return cls(scaled, tuple(round(inset * scale) for inset in insets))
+
+    def render(self, size):
+        """拼出指定尺寸的图片（尺寸小于四角之和时按四角之和计算）"""
+        left, top, right, bottom = self.insets
+        width = max(size[0], left + right)
+        height = max(size[1], top + bottom)
+        col_widths = (left, width - left - right, right)
+        row_heights = (top, height - top - bottom, bottom)
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        y = 0
+        for row in range(3):
+            x = 0
+            for col in range(3):
+                piece = self.pieces[row][col]
+                target = (col_widths[col], row_heights[row])
+                if target[0] > 0 and target[1] > 0:
+                    if piece.get_size() != target:
+                        piece = pygame.transform.smoothscale(piece, target)
+                    # 切片互不重叠，用MAX混合把像素原样复制到透明底上（普通blit会让半透明边缘变暗）
+                    surface.blit(piece, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+                x += col_widths[col]
+            y += row_heights[row]
+        return surface
@@ -0,0 +1,127 @@
+# src/renderer/render_queue.py
+"""渲染队列 - 收集一帧的绘制命令，按图层排序后批量提交"""
+
+import pygame
+from contextlib import contextmanager
+
+
+class RenderQueue:
+    """每帧的绘制命令列表
+
+    渲染器像使用窗口表面一样调用 blit，命令先记录下来，flush 时按图层排序，
+    连续的blit合并成一次 Surface.blits 调用；矩形用 draw_rect 记录。
+    """
+    # 图层（数值小的先画）
+    LAYER_BACKGROUND = 0
+    LAYER_CAT = 10
+    LAYER_UI = 20
+    LAYER_EFFECT = 30
+    LAYER_OVERLAY = 40
+
+    def __init__(self, target=None):
+        self.target = target
+        self.commands = []  # [(图层, 序号, 命令类型, 参数)]
+        self.current_layer = RenderQueue.LAYER_BACKGROUND
+
+        # 统计信息（最近一次 flush）
+        self.command_count = 0  # 记录的绘制命令数
+        self.deduplicated = 0  # 去掉的重复命令数
+        self.draw_calls = 0  # 实际调用的C函数次数（一次blits算一次）
+
+    def begin(self, target):
+        """开始新的一帧"""
+        self.target = target
+        self.commands.clear()
+        self.current_layer = RenderQueue.LAYER_BACKGROUND
+
+    @contextmanager
+    def layer(self, layer):
+        """with 语句中记录的命令都属于指定图层"""
+        previous, self.current_layer = self.current_layer, layer
+        try:
+            yield self
+        finally:
+            self.current_layer = previous
+
+    # ---- 与窗口表面相同的接口 ----
+
+    def get_size(self):
+        return self.target.get_size()
+
+    def get_width(self):
+        return self.target.get_width()
+
+    def get_height(self):
+        return self.target.get_height()
+
+    def get_rect(self, **kwargs):
+        return self.target.get_rect(**kwargs)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """记录一次blit，返回将要绘制的区域（与 Surface.blit 的返回值一致）"""
+        source_rect = source.get_rect()
+        if area is not None:
+            source_rect = source_rect.clip(pygame.Rect(area))
+        topleft = dest.topleft if isinstance(dest, pygame.Rect) else (int(dest[0]), int(dest[1]))
+        self._add("blit", (source, topleft, area, special_flags))
+        return pygame.Rect(topleft, source_rect.size).clip(self.target.get_rect())
+
+    def draw_rect(self, color, rect, width=0):
+        """记录一次矩形绘制，返回矩形区域"""
+        rect = pygame.Rect(rect)
+        self._add("rect", (color, rect, width))
+        return rect.clip(self.target.get_rect())
+
+    @staticmethod
+    def draw_rect_to(target, color, rect, width=0):
+        """在渲染队列或普通表面上画矩形"""
+        if isinstance(target, RenderQueue):
+            return target.draw_rect(color, rect, width)
+        return pygame.draw.rect(target, color, rect, width)
+
+    # ---- 提交 ----
+
+    def _add(self, kind, args):
+        self.commands.append((self.current_layer, len(self.commands), kind, args))
+
+    @staticmethod
+    def _is_idempotent(source):
+        """同一张不透明表面在同一位置重复blit结果不变，可以去重"""
+        return not source.get_flags() & pygame.SRCALPHA and source.get_alpha() in (None, 255)
+
+    def flush(self):
+        """按图层排序并提交所有命令"""
+        self.command_count = len(self.commands)
+        self.deduplicated = 0
+        self.draw_calls = 0
+
+        batch = []
+        previous = None
+        for _, _, kind, args in sorted(self.commands, key=lambda command: command[:2]):
+            if kind == "blit":
+                if args == previous and self._is_idempotent(args[0]):
+                    self.deduplicated += 1
+                    continue
+                batch.append(args)
+            else:
+                self._flush_batch(batch)
+                pygame.draw.rect(self.target, *args)
+                self.draw_calls += 1
+            previous = args
+        self._flush_batch(batch)
+        self.commands.clear()
+
+    def _flush_batch(self, batch):
+        """把连续的blit合并成一次 Surface.blits"""
+        if batch:
+            self.target.blits(batch, doreturn=False)
+            self.draw_calls += 1
+            batch.clear()
+
+    def get_stats(self):
+        """获取最近一次提交的统计信息"""
+        return {
+            "commands": self.command_count,
+            "deduplicated": self.deduplicated,
+            "draw_calls": self.draw_calls
+        }
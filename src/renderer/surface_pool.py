@@ -0,0 +1,67 @@
+# src/renderer/surface_pool.py
+"""临时表面池 - 淡入淡出和半透明遮罩复用同一批表面"""
+
+import pygame
+from contextlib import contextmanager
+
+
+class SurfacePool:
+    """按 (尺寸, 是否带逐像素透明) 缓存用完归还的临时表面，避免每帧新建Surface"""
+    MAX_FREE_PER_KEY = 2  # 每种规格最多保留的空闲表面数
+    _free = {}  # {(尺寸, 是否SRCALPHA): [空闲表面]}
+    _borrowed = {}  # {借出的表面: 规格}（set_alpha 会改变 get_flags，不能从表面反推规格）
+
+    # 统计信息
+    allocations = 0  # 真正新建的表面数
+    borrows = 0  # 借出次数
+    releases = 0  # 归还次数
+
+    @staticmethod
+    def _key(size, flags):
+        """表面规格"""
+        return tuple(size), bool(flags & pygame.SRCALPHA)
+
+    @staticmethod
+    def acquire(size, flags=0):
+        """借出一张表面（内容不确定，调用方需要自己填充）"""
+        SurfacePool.borrows += 1
+        key = SurfacePool._key(size, flags)
+        free = SurfacePool._free.get(key)
+        if free:
+            surface = free.pop()
+        else:
+            SurfacePool.allocations += 1
+            surface = pygame.Surface(size, flags)
+        SurfacePool._borrowed[surface] = key
+        return surface
+
+    @staticmethod
+    def release(surface):
+        """归还表面，恢复成不带整体透明度的状态"""
+        SurfacePool.releases += 1
+        key = SurfacePool._borrowed.pop(surface)
+        # 带逐像素透明的表面设为不透明即可，set_alpha(None) 会去掉它的混合模式
+        surface.set_alpha(255 if key[1] else None)
+        free = SurfacePool._free.setdefault(key, [])
+        if len(free) < SurfacePool.MAX_FREE_PER_KEY:
+            free.append(surface)
+
+    @staticmethod
+    @contextmanager
+    def borrowed(size, flags=0):
+        """with 语句中借用表面，结束时自动归还"""
+        surface = SurfacePool.acquire(size, flags)
+        try:
+            yield surface
+        finally:
+            SurfacePool.release(surface)
+
+    @staticmethod
+    def get_stats():
+        """获取表面池统计信息"""
+        return {
+            "allocations": SurfacePool.allocations,
+            "borrows": SurfacePool.borrows,
+            "releases": SurfacePool.releases,
+            "free": sum(len(free) for free in SurfacePool._free.values())
+        }
@@ -0,0 +1,52 @@
+# src/renderer/text_cache.py
+"""文字表面缓存 - 相同的文字只渲染一次"""
+
+from collections import OrderedDict
+from src.config.ui_layout import UILayout
+
+
+class TextCache:
+    """按 (文字, 字体, 颜色, 抗锯齿) 缓存渲染好的文字表面，超出容量时淘汰最久未用的条目
+
+    字体来自 FontRegistry，对象在整个运行期间不变，可以直接作为键的一部分
+    """
+    _surfaces = OrderedDict()
+    max_entries = UILayout.TEXT_CACHE_SIZE
+
+    # 统计信息
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def render(font, text, color, antialias=True):
+        """获取文字表面，缓存中没有时才调用 font.render（返回的表面是共享的，调用方不要修改）"""
+        key = (text, font, tuple(color), antialias)
+        surface = TextCache._surfaces.get(key)
+        if surface is not None:
+            TextCache._surfaces.move_to_end(key)
+            TextCache.hits += 1
+            return surface
+
+        TextCache.misses += 1
+        surface = font.render(text, antialias, color)
+        TextCache._surfaces[key] = surface
+        while len(TextCache._surfaces) > TextCache.max_entries:
+            TextCache._surfaces.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def clear():
+        """清空缓存和统计"""
+        TextCache._surfaces.clear()
+        TextCache.hits = TextCache.misses = 0
+
+    @staticmethod
+    def get_stats():
+        """获取缓存统计信息"""
+        total = TextCache.hits + TextCache.misses
+        return {
+            "entries": len(TextCache._surfaces),
+            "hits": TextCache.hits,
+            "misses": TextCache.misses,
+            "hit_rate": TextCache.hits / total if total else 0
+        }
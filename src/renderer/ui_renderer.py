@@ -1,78 +1,171 @@
 # src/renderer/ui_renderer.py
 """UI渲染器"""
 
+import math
 import pygame
 from src.config.game_config import GameConfig
 from src.config.ui_layout import UILayout
 from src.config.text_config import TextConfig
+from src.renderer.font_registry import FontRegistry
+from src.renderer.text_cache import TextCache
+from src.renderer.render_queue import RenderQueue
 
 
 class UIRenderer:
     """UI渲染器"""
+    _static_layers = {}  # {场景名: (布局键, (静态UI层, 绘制区域列表))}
+    static_layer_builds = 0  # 静态层重建次数
+    _message_backgrounds = {}  # {(尺寸, 颜色): 存档消息背景}，消息只有几种，不需要淘汰
+    TOUCH_BAR_WIDTH = 100  # 抚摸进度条宽度
 
     @staticmethod
-    def draw_progress_bar(window, value, prefix, pos):
-        """进度条绘制函数"""
-        # 根据数值范围直接决定用哪张图片
-        percent = 100 if value >= 90 else 80 if value >= 70 else 50 if value >= 45 else 30 if value >= 25 else 15
-        img_path = f"assets/images/ui/progress_bars/{prefix}_{percent}.png"
+    def get_bar_percent(value):
+        """根据数值范围决定用哪一档进度条图片"""
+        return 100 if value >= 90 else 80 if value >= 70 else 50 if value >= 45 else 30 if value >= 25 else 15
 
-        try:
-            bar_img = pygame.image.load(img_path).convert_alpha()
-            bar_img = pygame.transform.scale(bar_img, (70, 15))
-            window.blit(bar_img, pos)
-        except Exception as e:
-            print(f"进度条图片加载失败：{img_path},{e}")
+    @staticmethod
+    def get_bar_signature(value):
+        """进度条外观只取决于这个值：五档图片时是档位，连续绘制时是取整后的数值"""
+        if UILayout.CONTINUOUS_PROGRESS_BAR:
+            return round(max(0, min(value, 100)))
+        return UIRenderer.get_bar_percent(value)
 
     @staticmethod
-    def draw_fixed_ui(window, ui_images, cat_state, scene):
-        """绘制UI界面"""
-        # 根据场景选择UI位置
+    def draw_progress_bar(window, ui_images, value, prefix, pos):
+        """进度条绘制函数（使用加载时预先缩放好的图片），返回绘制区域"""
+        if UILayout.CONTINUOUS_PROGRESS_BAR:
+            return UIRenderer.draw_continuous_progress_bar(window, ui_images, value, prefix, pos)
+        return window.blit(ui_images[f"{prefix}_{UIRenderer.get_bar_percent(value)}"], pos)
+
+    @staticmethod
+    def draw_continuous_progress_bar(window, ui_images, value, prefix, pos):
+        """按0~100的任意数值绘制进度条：先画空槽，再按比例裁剪满格图片的填充区叠加上去，返回绘制区域
+
+        只复制边框之内的填充区，空槽的边框和两端不被满格图片覆盖
+        """
+        full_bar = ui_images[f"{prefix}_{UILayout.PROGRESS_BAR_PERCENTS[-1]}"]
+        rect = window.blit(ui_images[f"{prefix}_track"], pos)
+
+        width, height = full_bar.get_size()
+        start, end = UILayout.PROGRESS_BAR_FILL_SPAN
+        top, bottom = UILayout.PROGRESS_BAR_FILL_ROWS
+        fraction = max(0, min(value, 100)) / 100
+        fill_left = int(width * start)
+        fill_right = round(width * (start + (end - start) * fraction))
+        fill_top, fill_bottom = int(height * top), math.ceil(height * bottom)
+        if fill_right > fill_left:
+            window.blit(full_bar, (pos[0] + fill_left, pos[1] + fill_top),
+                        (fill_left, fill_top, fill_right - fill_left, fill_bottom - fill_top))
+        return rect
+
+    @staticmethod
+    def get_touch_display(progress):
+        """抚摸进度实际画出来的内容 (文字, 进度宽度)，绘制和画面签名共用同一套取整"""
+        return f"Touch: {progress:.0f}%", int(UIRenderer.TOUCH_BAR_WIDTH * (progress / 100))
+
+    @staticmethod
+    def get_bar_layout(scene):
+        """根据场景选择进度条位置，返回 (x, 健康条y, 心情条y)"""
         if scene.is_main_scene():
-            bar_x = UILayout.MAIN_PROGRESS_BAR_X
-            health_y = UILayout.MAIN_HEALTH_BAR_Y
-            mood_y = UILayout.MAIN_MOOD_BAR_Y
-        else:
-            bar_x = UILayout.ROOM_PROGRESS_BAR_X
-            health_y = UILayout.ROOM_HEALTH_BAR_Y
-            mood_y = UILayout.ROOM_MOOD_BAR_Y
-
-        UIRenderer.draw_progress_bar(window, cat_state.health, "health_bar", (bar_x, health_y))
-        UIRenderer.draw_progress_bar(window, cat_state.mood, "mood_bar", (bar_x, mood_y))
-
-        # 创建字体对象
-        font = pygame.font.SysFont(UILayout.FONT_NAME, UILayout.FONT_SIZE_UI, bold=True)
-        window.blit(font.render(TextConfig.HEALTH_LABEL, True, UILayout.FONT_COLOR),
-                    (bar_x, health_y + UILayout.LABEL_OFFSET_Y))
-        window.blit(font.render(TextConfig.MOOD_LABEL, True, UILayout.FONT_COLOR),
-                    (bar_x, mood_y + UILayout.LABEL_OFFSET_Y))
+            return UILayout.MAIN_PROGRESS_BAR_X, UILayout.MAIN_HEALTH_BAR_Y, UILayout.MAIN_MOOD_BAR_Y
+        return UILayout.ROOM_PROGRESS_BAR_X, UILayout.ROOM_HEALTH_BAR_Y, UILayout.ROOM_MOOD_BAR_Y
+
+    @staticmethod
+    def get_labels(scene):
+        """进度条标签，返回 [(文字表面, 位置, 是否压在进度条上), ...]"""
+        bar_x, health_y, mood_y = UIRenderer.get_bar_layout(scene)
+        bar_rects = [pygame.Rect((bar_x, y), UILayout.PROGRESS_BAR_SIZE) for y in (health_y, mood_y)]
+        font = FontRegistry.get(UILayout.FONT_SIZE_UI, bold=True)
+        labels = []
+        for text, bar_y in ((TextConfig.HEALTH_LABEL, health_y), (TextConfig.MOOD_LABEL, mood_y)):
+            surface = TextCache.render(font, text, UILayout.FONT_COLOR)
+            pos = (bar_x, bar_y + UILayout.LABEL_OFFSET_Y)
+            labels.append((surface, pos, surface.get_rect(topleft=pos).collidelist(bar_rects) != -1))
+        return labels
+
+    @staticmethod
+    def draw_static_ui(window, ui_images, scene):
+        """绘制场景内不会变化的UI：进度条标签、切换按钮和存档提示，返回绘制区域列表"""
+        rects = []
+        for surface, pos, overlaps_bar in UIRenderer.get_labels(scene):
+            if not overlaps_bar:
+                rects.append(window.blit(surface, pos))
+
+        rects += UIRenderer.draw_buttons(window, ui_images, scene)
+
+        # 显示存档提示
+        hint_font = FontRegistry.get(UILayout.FONT_SIZE_INFO)
+        hint_surface = TextCache.render(hint_font, UILayout.SAVE_HINT_TEXT, UILayout.SAVE_HINT_COLOR)
+        rects.append(window.blit(hint_surface, (10, window.get_height() - 20)))
+        return rects
+
+    @staticmethod
+    def get_background(ui_images, scene):
+        """场景背景图（加载时已缩放到窗口尺寸）"""
+        return ui_images["main_background" if scene.is_main_scene() else "room_background"]
+
+    @staticmethod
+    def get_static_layer(ui_images, scene):
+        """获取场景的静态UI层，返回 (透明图层, 绘制区域列表)
+
+        不变的UI预先画到一张透明图上，每帧只按区域贴回；它们要盖在猫咪上面，所以不和背景合成。
+        场景、窗口或布局配置变化时才重建
+        """
+        key = (scene.window.get_size(), UIRenderer.get_bar_layout(scene),
+               GameConfig.BUTTON_Y, GameConfig.RIGHT_BUTTON_X, GameConfig.LEFT_BUTTON_X,
+               UILayout.LABEL_OFFSET_Y, UILayout.FONT_SIZE_UI, UILayout.FONT_COLOR)
+        cached = UIRenderer._static_layers.get(scene.current_scene)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        layer = pygame.Surface(scene.window.get_size(), pygame.SRCALPHA)
+        rects = UIRenderer.draw_static_ui(layer, ui_images, scene)
+        UIRenderer._static_layers[scene.current_scene] = (key, (layer, rects))
+        UIRenderer.static_layer_builds += 1
+        print(f"🧱 重建{scene.current_scene}场景静态层")
+        return layer, rects
+
+    @staticmethod
+    def draw_fixed_ui(window, ui_images, cat_state, scene):
+        """绘制会变化的UI（进度条、抚摸进度），返回绘制区域列表"""
+        bar_x, health_y, mood_y = UIRenderer.get_bar_layout(scene)
+
+        rects = [
+            UIRenderer.draw_progress_bar(window, ui_images, cat_state.health, "health_bar", (bar_x, health_y)),
+            UIRenderer.draw_progress_bar(window, ui_images, cat_state.mood, "mood_bar", (bar_x, mood_y))
+        ]
+        # 压在进度条上的标签不放进静态层，画在进度条之后
+        for surface, pos, overlaps_bar in UIRenderer.get_labels(scene):
+            if overlaps_bar:
+                rects.append(window.blit(surface, pos))
 
         # 在主场景显示抚摸进度条（如果正在抚摸）
         if scene.is_main_scene() and "touch" in cat_state.current_needs:
-            progress_text = f"Touch: {cat_state.touch_system.touch_progress:.0f}%"
-            text_surface = font.render(progress_text, True, UILayout.FONT_COLOR)
-            window.blit(text_surface, (150, 200))
+            font = FontRegistry.get(UILayout.FONT_SIZE_UI, bold=True)
+            progress_text, progress_width = UIRenderer.get_touch_display(cat_state.touch_system.touch_progress)
+            text_surface = TextCache.render(font, progress_text, UILayout.FONT_COLOR)
+            rects.append(window.blit(text_surface, (150, 200)))
 
             # 小巧的进度条
-            bar_width = 100
+            bar_width = UIRenderer.TOUCH_BAR_WIDTH
             bar_height = 15
             bar_x = 150
             bar_y = 220
 
             # 背景
-            pygame.draw.rect(window, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height))
+            rects.append(RenderQueue.draw_rect_to(window, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height)))
 
             # 进度
-            progress_width = int(bar_width * (cat_state.touch_system.touch_progress / 100))
             if progress_width > 0:
-                pygame.draw.rect(window, (100, 200, 100), (bar_x, bar_y, progress_width, bar_height))
+                RenderQueue.draw_rect_to(window, (100, 200, 100), (bar_x, bar_y, progress_width, bar_height))
             # 边框
-            pygame.draw.rect(window, (60, 30, 0), (bar_x, bar_y, bar_width, bar_height), 2)
+            RenderQueue.draw_rect_to(window, (60, 30, 0), (bar_x, bar_y, bar_width, bar_height), 2)
+        return rects
 
     @staticmethod
     def draw_time_display(window, game_time):
-        """绘制时间显示"""
-        font = pygame.font.SysFont(UILayout.FONT_NAME, UILayout.FONT_SIZE_TIME, bold=True)
+        """绘制时间显示，返回绘制区域列表"""
+        font = FontRegistry.get(UILayout.FONT_SIZE_TIME, bold=True)
         # 根据白天/夜晚选择颜色
         color = UILayout.TIME_COLOR_DAY if game_time.is_daytime() else UILayout.TIME_COLOR_NIGHT
 
@@ -81,31 +174,45 @@ class UIRenderer:
         if game_time.is_sleeping:
             time_string += " 💤"
 
-        window.blit(font.render(time_string, True, color),
-                    (UILayout.TIME_DISPLAY_X, UILayout.TIME_DISPLAY_Y))
+        rects = [window.blit(TextCache.render(font, time_string, color),
+                             (UILayout.TIME_DISPLAY_X, UILayout.TIME_DISPLAY_Y))]
 
         # 显示白天/夜晚状态
         status = "☀️ Day" if game_time.is_daytime() else "🌙 Night"
-        window.blit(font.render(status, True, color),
-                    (UILayout.TIME_DISPLAY_X, UILayout.TIME_DISPLAY_Y + 20))
+        rects.append(window.blit(TextCache.render(font, status, color),
+                                 (UILayout.TIME_DISPLAY_X, UILayout.TIME_DISPLAY_Y + 20)))
+        return rects
 
     @staticmethod
     def draw_buttons(window, ui_images, scene):
-        """绘制按钮"""
+        """绘制按钮，返回绘制区域列表"""
         if scene.is_main_scene():
-            window.blit(ui_images["right_button"], (GameConfig.RIGHT_BUTTON_X, GameConfig.BUTTON_Y))
-        else:
-            window.blit(ui_images["left_button"], (GameConfig.LEFT_BUTTON_X, GameConfig.BUTTON_Y - 50))
+            return [window.blit(ui_images["right_button"], (GameConfig.RIGHT_BUTTON_X, GameConfig.BUTTON_Y))]
+        return [window.blit(ui_images["left_button"], (GameConfig.LEFT_BUTTON_X, GameConfig.BUTTON_Y - 50))]
+
+    @staticmethod
+    def get_message_background(size, color):
+        """存档消息的半透明背景，按 (尺寸, 颜色) 缓存
+
+        渲染队列到本帧提交时才读取表面，所以背景不能借用后立即归还，缓存的表面一直有效
+        """
+        key = (size, color)
+        surface = UIRenderer._message_backgrounds.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(color)
+            UIRenderer._message_backgrounds[key] = surface
+        return surface
 
     @staticmethod
     def draw_save_message(window, cat_state):
-        """绘制存档消息"""
+        """绘制存档消息，返回绘制区域列表"""
         if cat_state is None:
-            return
+            return []
         if cat_state.last_save_message and cat_state.save_message_timer > 0:
             # 创建半透明背景
-            font = pygame.font.SysFont(UILayout.FONT_NAME, 18, bold=True)
-            text_surface = font.render(cat_state.last_save_message, True, (255, 255, 255))
+            font = FontRegistry.get(UILayout.FONT_SIZE_SAVE_MESSAGE, bold=True)
+            text_surface = TextCache.render(font, cat_state.last_save_message, (255, 255, 255))
             text_rect = text_surface.get_rect()
 
             # 计算位置（屏幕右上角）
@@ -124,35 +231,31 @@ class UIRenderer:
             else:
                 bg_color = (70, 130, 180, 180)  # 蓝色（自动保存）
 
-            # 创建半透明表面
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-            bg_surface.fill(bg_color)
-            window.blit(bg_surface, (bg_rect.x, bg_rect.y))
+            rect = window.blit(UIRenderer.get_message_background(bg_rect.size, bg_color), (bg_rect.x, bg_rect.y))
 
             # 绘制文字
             window.blit(text_surface, (message_x, message_y))
+            return [rect]
+        return []
 
     @staticmethod
     def draw_game_info(window, cat_state):
-        """绘制游戏信息（时长等）"""
+        """绘制游戏信息（时长等），返回绘制区域列表"""
         if cat_state is None:
-            return
+            return []
 
-        font = pygame.font.SysFont(UILayout.FONT_NAME, 12)
+        font = FontRegistry.get(UILayout.FONT_SIZE_INFO)
 
         # 显示游戏时长
         play_time_minutes = int(cat_state.play_time // 60)
         play_time_seconds = int(cat_state.play_time % 60)
         time_text = f"Time: {play_time_minutes:02d}:{play_time_seconds:02d}"
-        time_surface = font.render(time_text, True, UILayout.FONT_COLOR)
+        time_surface = TextCache.render(font, time_text, UILayout.FONT_COLOR)
 
         # 根据场景选择位置
         if window.get_width() == GameConfig.MAIN_WINDOW_SIZE[0]:  # 主场景
-            window.blit(time_surface, (10, 50))
+            rects = [window.blit(time_surface, (10, 50))]
         else:  # 房间场景
-            window.blit(time_surface, (10, 80))
+            rects = [window.blit(time_surface, (10, 80))]
 
-        # 显示存档提示
-        hint_text = "F5:Save F9:Load"
-        hint_surface = font.render(hint_text, True, (128, 128, 128))
-        window.blit(hint_surface, (10, window.get_height() - 20))
+        return rects
@@ -5,5 +5,11 @@ from .resource_manager import ResourceManager
 from .save_manager import SaveManager
 from .touch_system import TouchSystem
 from .loading_state import LoadingState
+from .texture_atlas import TextureAtlas
+from .frame_cache import FrameCache
+from .animation_store import AnimationStore
+from .asset_manifest import AssetManifest
+from .hot_reload import HotReloader
+from .asset_pack import AssetPack
 
-__all__ = ['ResourceManager', 'SaveManager', 'TouchSystem', 'LoadingState']
\ No newline at end of file
+__all__ = ['ResourceManager', 'SaveManager', 'TouchSystem', 'LoadingState', 'TextureAtlas', 'FrameCache', 'AnimationStore', 'AssetManifest', 'HotReloader', 'AssetPack']
\ No newline at end of file
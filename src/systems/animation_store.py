@@ -0,0 +1,170 @@
+# src/systems/animation_store.py
+"""动画仓库 - 按需加载动画并按内存预算淘汰"""
+
+import time
+import pygame
+from collections import OrderedDict
+from src.config.game_config import GameConfig
+from src.config.animation_config import AnimationConfig
+from src.systems.resource_manager import ResourceManager
+
+
+class AnimationStore:
+    """按 (场景, 状态) 管理动画帧：首次使用时加载，超出字节预算时淘汰最久未用的状态"""
+    PINNED_STATES = ("normal",)  # 常驻状态，同时也是加载失败时的备用动画
+
+    def __init__(self, budget_bytes=GameConfig.ANIMATION_MEMORY_BUDGET, loader=None):
+        self.budget_bytes = budget_bytes  # None 表示不限制
+        self.loader = loader or ResourceManager.load_state_bank  # 状态 -> {场景: 帧列表}
+        self.entries = OrderedDict()  # {(场景, 状态): 帧列表}，按最近使用排序
+        self.entry_bytes = {}
+        self.total_bytes = 0
+        self.failed = set()  # 加载失败的 (场景, 状态)
+        self.unconverted = set()  # 无头模式下加载、还没转换成显示格式的 (场景, 状态)
+
+        # 统计信息
+        self.load_count = 0
+        self.eviction_count = 0
+
+    @classmethod
+    def from_animations(cls, animations):
+        """用已经全部加载好的动画字典创建仓库（不淘汰）"""
+        store = cls(budget_bytes=None)
+        for scene_type, states in animations.items():
+            for status, frames in states.items():
+                store.put(scene_type, status, frames)
+        return store
+
+    @staticmethod
+    def frames_bytes(frames):
+        """一组帧占用的像素内存字节数（重复出现的同一个表面只计一次）
+
+        图集子表面和图集页共用像素，淘汰也释放不了，不计入预算
+        """
+        unique = {id(frame): frame for frame in frames if frame.get_parent() is None}.values()
+        return sum(frame.get_pitch() * frame.get_height() for frame in unique)
+
+    def put(self, scene_type, status, frames):
+        """放入一组帧并按预算淘汰"""
+        key = (scene_type, status)
+        if key in self.entries:
+            self.total_bytes -= self.entry_bytes[key]
+        self.entries[key] = frames
+        self.entries.move_to_end(key)
+        self.entry_bytes[key] = self.frames_bytes(frames)
+        self.total_bytes += self.entry_bytes[key]
+        if ResourceManager.has_display():
+            self.unconverted.discard(key)
+        else:
+            self.unconverted.add(key)
+        self._evict(keep=key)
+
+    def _convert(self, key):
+        """有显示模式后把无头模式加载的帧原地转换成显示格式"""
+        frames = self.entries[key]
+        ResourceManager.convert_resources(frames)
+        self.total_bytes += self.frames_bytes(frames) - self.entry_bytes[key]
+        self.entry_bytes[key] = self.frames_bytes(frames)
+        self.unconverted.discard(key)
+
+    def replace_frame(self, scene_type, status, index, frame):
+        """原地替换已加载动画中的一帧（热重载使用，共享同一帧列表的备用动画一起更新）"""
+        key = (scene_type, status)
+        frames = self.entries.get(key)
+        if frames is None or index >= len(frames):
+            return False
+        frames[index] = frame
+        new_bytes = self.frames_bytes(frames)
+        self.total_bytes += new_bytes - self.entry_bytes[key]
+        self.entry_bytes[key] = new_bytes
+        return True
+
+    def _evict(self, keep):
+        """淘汰最久未使用的非常驻状态，直到回到预算以内"""
+        if self.budget_bytes is None:
+            return
+        for key in list(self.entries):
+            if self.total_bytes <= self.budget_bytes:
+                break
+            if key == keep or key[1] in self.PINNED_STATES:
+                continue
+            del self.entries[key]
+            self.total_bytes -= self.entry_bytes.pop(key)
+            self.unconverted.discard(key)
+            self.eviction_count += 1
+            print(f"♻️ 淘汰动画 {key[0]}/{key[1]}，当前占用 {self.total_bytes / 1024:.0f}KB")
+
+    def get_frames(self, scene_type, status):
+        """获取动画帧，未加载时按需加载，加载失败时使用normal动画"""
+        key = (scene_type, status)
+        frames = self.entries.get(key)
+        if frames is not None:
+            self.entries.move_to_end(key)
+            if key in self.unconverted and ResourceManager.has_display():
+                self._convert(key)
+            return frames
+
+        if key not in self.failed and status in AnimationConfig.ANIMATION:
+            # 一次解码出所有场景尺寸，其他场景还没加载的也一起放入仓库
+            bank = self.loader(status)
+            self.load_count += 1
+            for other_scene, other_frames in bank.items():
+                if other_scene != scene_type and other_frames and (other_scene, status) not in self.entries:
+                    self.put(other_scene, status, other_frames)
+            frames = bank.get(scene_type)
+            if frames:
+                self.put(scene_type, status, frames)
+                return frames
+            self.failed.add(key)
+            print(f"⚠️  {scene_type}/{status}动画加载失败，将使用默认动画")
+
+        if status == "normal":
+            return []
+        return self.get_frames(scene_type, "normal")
+
+    def preload(self, scene_types, statuses):
+        """预先加载指定动画，返回是否全部加载成功"""
+        return all(self.get_frames(scene_type, status) and (scene_type, status) not in self.failed
+                   for scene_type in scene_types for status in statuses)
+
+    @staticmethod
+    def measure_blit(frames, repeats=200):
+        """测量一组帧平均每次blit的耗时（微秒）"""
+        target = pygame.display.get_surface() or pygame.Surface(GameConfig.ROOM_WINDOW_SIZE)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for frame in frames:
+                target.blit(frame, (0, 0))
+        return (time.perf_counter() - start) / (repeats * len(frames)) * 1e6 if frames else 0
+
+    def memory_report(self, measure_blits=False):
+        """按场景和状态统计动画帧内存（共享的备用帧只计一次），可选测量blit耗时"""
+        report = {}
+        counted = set()
+        for (scene_type, status), frames in sorted(self.entries.items()):
+            shared = id(frames) in counted
+            counted.add(id(frames))
+            entry = {"frames": len(frames), "bytes": 0 if shared else self.frames_bytes(frames), "shared": shared}
+            if measure_blits and not shared:
+                entry["blit_us"] = self.measure_blit(frames)
+            report.setdefault(scene_type, {})[status] = entry
+
+        print("📊 动画帧内存报告")
+        for scene_type, states in report.items():
+            for status, entry in states.items():
+                note = "（共享备用动画）" if entry["shared"] else ""
+                blit = f", blit {entry['blit_us']:.2f}µs" if "blit_us" in entry else ""
+                print(f"  {scene_type}/{status}: {entry['frames']}帧, {entry['bytes'] / 1024:.1f}KB{blit}{note}")
+            scene_bytes = sum(entry["bytes"] for entry in states.values())
+            print(f"  ▶ {scene_type} 合计: {scene_bytes / 1024:.1f}KB")
+        return report
+
+    def get_stats(self):
+        """获取仓库统计信息"""
+        return {
+            "loaded_states": len(self.entries),
+            "total_bytes": self.total_bytes,
+            "budget_bytes": self.budget_bytes,
+            "loads": self.load_count,
+            "evictions": self.eviction_count
+        }
@@ -0,0 +1,166 @@
+# src/systems/asset_manifest.py
+"""资源清单 - 记录所有资源文件，替代运行时的目录扫描和逐个存在性检查"""
+
+import hashlib
+import json
+import os
+import pygame
+from src.config.game_config import GameConfig
+
+
+class AssetManifest:
+    """资源清单：每个资源的路径、大小、尺寸和校验和
+
+    由 python -m src.utilis.build_manifest 生成，运行时所有加载器都通过清单判断文件是否存在。
+    """
+    VERSION = 1
+    IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg")
+
+    _instance = None  # 已加载的清单（None表示未加载，False表示不可用）
+
+    def __init__(self, entries):
+        self.entries = entries  # {"assets/...": {"size": 字节数, "width": 宽, "height": 高, "sha1": 校验和}}
+        self.stale_paths = []
+
+    @staticmethod
+    def get_manifest_path():
+        """清单文件路径"""
+        from src.systems.resource_manager import ResourceManager
+        return ResourceManager.get_project_root() / GameConfig.ASSET_MANIFEST_FILE
+
+    @staticmethod
+    def get():
+        """获取资源清单（只加载一次），未启用或不存在时返回None，调用方回退到文件系统检查"""
+        if AssetManifest._instance is None:
+            manifest = AssetManifest.load() if GameConfig.USE_ASSET_MANIFEST else None
+            AssetManifest._instance = manifest or False
+        return AssetManifest._instance or None
+
+    @staticmethod
+    def _is_generated(relative_path):
+        """烘焙产物和清单本身不记录在清单里"""
+        return (relative_path == GameConfig.ASSET_MANIFEST_FILE or
+                relative_path.startswith(GameConfig.ATLAS_DIR + "/"))
+
+    @staticmethod
+    def build():
+        """扫描 assets 目录生成清单"""
+        from src.systems.resource_manager import ResourceManager
+        project_root = ResourceManager.get_project_root()
+        entries = {}
+        print("🔄 开始生成资源清单...")
+
+        for dir_path, dir_names, file_names in os.walk(project_root / "assets"):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                full_path = os.path.join(dir_path, file_name)
+                relative_path = os.path.relpath(full_path, project_root).replace(os.sep, "/")
+                if AssetManifest._is_generated(relative_path):
+                    continue
+
+                with open(full_path, 'rb') as f:
+                    data = f.read()
+                entry = {"size": len(data), "sha1": hashlib.sha1(data).hexdigest()}
+                if file_name.lower().endswith(AssetManifest.IMAGE_SUFFIXES):
+                    try:
+                        entry["width"], entry["height"] = pygame.image.load(full_path).get_size()
+                    except pygame.error as e:
+                        print(f"⚠️  无法读取图片尺寸 {relative_path}: {e}")
+                entries[relative_path] = entry
+
+        # 不记录生成时间，资源没有变化时重新生成的清单与已提交的完全相同
+        manifest = {"version": AssetManifest.VERSION, "assets": entries}
+        with open(AssetManifest.get_manifest_path(), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        print(f"✅ 资源清单生成完成：{len(entries)}个文件")
+        return AssetManifest(entries)
+
+    @staticmethod
+    def load():
+        """读取清单并做快速过期检查，读取失败时返回None"""
+        manifest_path = AssetManifest.get_manifest_path()
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            print(f"⚠️  资源清单不存在: {manifest_path}，使用目录检查")
+            return None
+        except Exception as e:
+            print(f"❌ 资源清单读取失败 {manifest_path}: {e}")
+            return None
+
+        if data.get("version") != AssetManifest.VERSION:
+            print("⚠️  资源清单版本不符，请重新生成，使用目录检查")
+            return None
+
+        manifest = AssetManifest(data["assets"])
+        manifest.check_stale()
+        print(f"✅ 资源清单加载成功：{len(manifest.entries)}个文件")
+        return manifest
+
+    def check_stale(self, deep=False):
+        """检查清单是否与磁盘文件一致，返回过期的路径列表
+
+        快速检查只比较文件大小（每个文件一次stat，不扫描目录）；
+        deep=True 时额外比较校验和，并扫描目录找出清单中没有的新文件
+        """
+        from src.systems.resource_manager import ResourceManager
+        project_root = ResourceManager.get_project_root()
+        stale_paths = []
+
+        for relative_path, entry in self.entries.items():
+            full_path = project_root / relative_path
+            try:
+                if full_path.stat().st_size != entry["size"]:
+                    stale_paths.append(relative_path)
+                elif deep:
+                    with open(full_path, 'rb') as f:
+                        if hashlib.sha1(f.read()).hexdigest() != entry["sha1"]:
+                            stale_paths.append(relative_path)
+            except FileNotFoundError:
+                stale_paths.append(relative_path)
+
+        if deep:
+            for full_path in (project_root / "assets").rglob("*"):
+                relative_path = full_path.relative_to(project_root).as_posix()
+                if (full_path.is_file() and relative_path not in self.entries and
+                        not AssetManifest._is_generated(relative_path)):
+                    stale_paths.append(relative_path)
+
+        self.stale_paths = stale_paths
+        if stale_paths:
+            print(f"⚠️  资源清单已过期（{len(stale_paths)}个文件不一致，例如 {stale_paths[:3]}），"
+                  f"请运行 python -m src.utilis.build_manifest 重新生成")
+        return stale_paths
+
+    def mark_stale(self, relative_path):
+        """标记某个文件已在磁盘上改动（热重载时使用）"""
+        if relative_path not in self.stale_paths:
+            self.stale_paths.append(relative_path)
+
+    def has(self, relative_path):
+        """资源是否存在"""
+        return relative_path in self.entries
+
+    def get_entry(self, relative_path):
+        """获取资源的清单条目"""
+        return self.entries.get(relative_path)
+
+    def get_checksum(self, relative_path):
+        """获取资源的校验和，清单已过期的文件返回None"""
+        entry = self.entries.get(relative_path)
+        if entry is None or relative_path in self.stale_paths:
+            return None
+        return entry["sha1"]
+
+    @staticmethod
+    def filter_files(paths, folder, prefix="", suffix=""):
+        """从资源路径中筛选某个文件夹下（不含子文件夹）符合前后缀的文件，排序后返回（资源包索引共用）"""
+        folder = folder.rstrip("/") + "/"
+        return sorted(path for path in paths
+                      if path.startswith(folder) and "/" not in path[len(folder):]
+                      and path[len(folder):].startswith(prefix) and path.endswith(suffix))
+
+    def list_files(self, folder, prefix="", suffix=""):
+        """列出某个文件夹下（不含子文件夹）符合前后缀的资源"""
+        return AssetManifest.filter_files(self.entries, folder, prefix, suffix)
@@ -0,0 +1,151 @@
+# src/systems/asset_pack.py
+"""资源包 - 把所有资源打包成一个文件，通过mmap读取"""
+
+import hashlib
+import io
+import json
+import mmap
+import struct
+from src.config.game_config import GameConfig
+from src.systems.asset_manifest import AssetManifest
+
+
+class MappedAsset(io.RawIOBase):
+    """资源包中一个文件的只读视图，直接从映射内存读取，可交给 pygame.image.load"""
+
+    def __init__(self, view):
+        super().__init__()
+        self._view = view
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = min(len(buffer), len(self._view) - self._position)
+        buffer[:count] = self._view[self._position:self._position + count]
+        self._position += count
+        return count
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._position = max(0, min(offset, len(self._view)))
+        return self._position
+
+    def tell(self):
+        return self._position
+
+
+class AssetPack:
+    """单文件资源包：文件头 + 索引 + 连续存放的资源数据
+
+    文件布局：魔数(8字节) | 索引长度(uint32) | 索引JSON | 资源数据
+    索引：{"assets/...": {"offset": 数据区内偏移, "size": 字节数, "sha1": 校验和}}
+    """
+    MAGIC = b"PETPAK01"
+    HEADER = struct.Struct("<8sI")
+
+    _instance = None  # 已打开的资源包（None表示未打开，False表示不可用）
+
+    def __init__(self, mapped, index, data_offset):
+        self._mapped = mapped
+        self.index = index
+        self.data_offset = data_offset
+
+    @staticmethod
+    def get_pack_path():
+        """资源包文件路径"""
+        from src.systems.resource_manager import ResourceManager
+        return ResourceManager.get_project_root() / GameConfig.ASSET_PACK_FILE
+
+    @staticmethod
+    def get():
+        """获取资源包（只打开一次），配置为散装目录或资源包不存在时返回None"""
+        if AssetPack._instance is None:
+            pack = AssetPack.open() if GameConfig.ASSET_SOURCE == "pack" else None
+            AssetPack._instance = pack or False
+        return AssetPack._instance or None
+
+    @staticmethod
+    def build(output_path=None):
+        """把 assets 目录下所有资源写进一个资源包"""
+        from src.systems.resource_manager import ResourceManager
+        project_root = ResourceManager.get_project_root()
+        output_path = output_path or AssetPack.get_pack_path()
+        print(f"🔄 开始打包资源 -> {output_path}")
+
+        # 有资源清单时按清单打包，否则扫描 assets 目录
+        manifest = AssetManifest.get()
+        if manifest:
+            relative_paths = sorted(manifest.entries)
+        else:
+            relative_paths = sorted(path.relative_to(project_root).as_posix()
+                                    for path in (project_root / "assets").rglob("*") if path.is_file())
+
+        index = {}
+        blobs = []
+        offset = 0
+        for relative_path in relative_paths:
+            with open(project_root / relative_path, 'rb') as f:
+                data = f.read()
+            index[relative_path] = {"offset": offset, "size": len(data), "sha1": hashlib.sha1(data).hexdigest()}
+            blobs.append(data)
+            offset += len(data)
+
+        index_bytes = json.dumps(index, ensure_ascii=False).encode("utf-8")
+        with open(output_path, 'wb') as f:
+            f.write(AssetPack.HEADER.pack(AssetPack.MAGIC, len(index_bytes)))
+            f.write(index_bytes)
+            for data in blobs:
+                f.write(data)
+        print(f"✅ 资源打包完成：{len(index)}个文件，{offset / 1024:.0f}KB")
+
+    @staticmethod
+    def open(pack_path=None):
+        """映射资源包并读取索引，失败时返回None"""
+        pack_path = pack_path or AssetPack.get_pack_path()
+        try:
+            with open(pack_path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            print(f"⚠️  资源包不存在: {pack_path}，使用散装资源目录")
+            return None
+
+        try:
+            magic, index_length = AssetPack.HEADER.unpack_from(mapped)
+            if magic != AssetPack.MAGIC:
+                raise ValueError("魔数不符")
+            data_offset = AssetPack.HEADER.size + index_length
+            index = json.loads(mapped[AssetPack.HEADER.size:data_offset].decode("utf-8"))
+        except Exception as e:
+            print(f"❌ 资源包损坏 {pack_path}: {e}，使用散装资源目录")
+            mapped.close()
+            return None
+
+        print(f"✅ 资源包加载成功：{len(index)}个文件")
+        return AssetPack(mapped, index, data_offset)
+
+    def has(self, relative_path):
+        """资源包中是否有这个文件"""
+        return relative_path in self.index
+
+    def get_checksum(self, relative_path):
+        """获取文件的校验和"""
+        entry = self.index.get(relative_path)
+        return entry["sha1"] if entry else None
+
+    def open_asset(self, relative_path):
+        """以文件对象的形式打开资源（直接读取映射内存，不复制整个文件）"""
+        entry = self.index[relative_path]
+        start = self.data_offset + entry["offset"]
+        return MappedAsset(memoryview(self._mapped)[start:start + entry["size"]])
+
+    def list_files(self, folder, prefix="", suffix=""):
+        """列出某个文件夹下（不含子文件夹）符合前后缀的资源"""
+        return AssetManifest.filter_files(self.index, folder, prefix, suffix)
@@ -0,0 +1,192 @@
+# src/systems/frame_cache.py
+"""缩放帧磁盘缓存 - 热启动时跳过PNG解码和缩放"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import atexit
+import threading
+from src.config.game_config import GameConfig
+
+
+class FrameCache:
+    """已缩放帧的原始RGBA像素缓存
+
+    每个条目按 源文件哈希 + 目标尺寸 + 像素格式 命名，读取时通过mmap映射，
+    直接交给 pygame.image.frombuffer 使用。源文件内容变化时旧条目被清理，
+    GameConfig 中的尺寸配置变化时整个缓存目录失效。
+    """
+    PIXEL_FORMAT = "RGBA"
+    MAGIC = b"PFC1"
+    HEADER = struct.Struct("<4sII")  # 魔数, 宽, 高
+    INDEX_FILE = "index.json"
+    INDEX_VERSION = 2
+
+    _lock = threading.Lock()
+    _index = None  # {"signature": 配置签名, "sources": {源文件: {"sha1": 哈希, "size": 字节数, "mtime_ns": 修改时间}}}
+    _index_dirty = False  # 索引有改动还没写回磁盘
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def get_cache_dir():
+        """缓存目录"""
+        from src.systems.resource_manager import ResourceManager
+        return ResourceManager.get_project_root() / GameConfig.FRAME_CACHE_DIR
+
+    @staticmethod
+    def config_signature():
+        """影响缩放结果的配置签名，任意一项变化都会让缓存整体失效"""
+        sizes = {
+            "cat_scene_sizes": GameConfig.CAT_SCENE_SIZES,
+            "loading_cat_size": GameConfig.LOADING_CAT_SIZE,
+            "main_window_size": GameConfig.MAIN_WINDOW_SIZE,
+            "room_window_size": GameConfig.ROOM_WINDOW_SIZE,
+            "button_size": GameConfig.BUTTON_SIZE,
+            "pixel_format": FrameCache.PIXEL_FORMAT,
+            "index_version": FrameCache.INDEX_VERSION
+        }
+        return hashlib.sha1(json.dumps(sizes, sort_keys=True).encode()).hexdigest()
+
+    @staticmethod
+    def _save_index():
+        """写回索引文件（调用方持有锁）"""
+        index_path = FrameCache.get_cache_dir() / FrameCache.INDEX_FILE
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(FrameCache._index, f, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    def _remove_entries(pattern):
+        """删除匹配的缓存条目（调用方持有锁）"""
+        for entry in FrameCache.get_cache_dir().glob(pattern):
+            try:
+                entry.unlink()
+            except OSError as e:
+                print(f"⚠️  无法删除缓存条目 {entry}: {e}")
+
+    @staticmethod
+    def _ensure_index():
+        """加载索引，配置签名不一致时清空缓存（调用方持有锁）"""
+        if FrameCache._index is not None:
+            return
+        cache_dir = FrameCache.get_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        index = None
+        try:
+            with open(cache_dir / FrameCache.INDEX_FILE, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️  帧缓存索引损坏，重建缓存: {e}")
+
+        signature = FrameCache.config_signature()
+        FrameCache._index = index
+        if not index or index.get("signature") != signature:
+            if index:
+                print("🔄 尺寸配置已变化，清空帧缓存")
+            FrameCache._remove_entries("*.raw")
+            FrameCache._index = {"signature": signature, "sources": {}}
+            FrameCache._save_index()
+
+    @staticmethod
+    def source_hash(file_path, checksum=None):
+        """获取源文件哈希，源文件内容变化时清理不再被任何源文件使用的旧缓存条目
+
+        checksum: 实际读取的数据自带的校验和（资源包），此时不检查磁盘文件；
+        不传时以磁盘文件为准：大小和修改时间与索引记录一致时直接使用记录的哈希，否则读取文件重新计算
+        """
+        from src.systems.resource_manager import ResourceManager
+        source = os.path.relpath(file_path, ResourceManager.get_project_root())
+        with FrameCache._lock:
+            FrameCache._ensure_index()
+            entry = FrameCache._index["sources"].get(source)
+
+        if checksum is None:
+            stat = os.stat(file_path)
+            if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+                return entry["sha1"]
+            with open(file_path, 'rb') as f:
+                checksum = hashlib.sha1(f.read()).hexdigest()
+            new_entry = {"sha1": checksum, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        else:
+            if entry and entry["sha1"] == checksum and "size" not in entry:
+                return checksum
+            new_entry = {"sha1": checksum}
+
+        with FrameCache._lock:
+            sources = FrameCache._index["sources"]
+            old_entry = sources.get(source)
+            sources[source] = new_entry
+            # 内容相同的源文件共享缓存条目，只有没有任何源文件再用旧哈希时才删除
+            old_hash = old_entry["sha1"] if old_entry else None
+            if old_hash and old_hash != checksum and \
+                    not any(other["sha1"] == old_hash for other in sources.values()):
+                FrameCache._remove_entries(f"{old_hash}_*.raw")
+            FrameCache._index_dirty = True
+        return checksum
+
+    @staticmethod
+    def flush():
+        """把索引的改动写回磁盘（一批加载结束时调用一次，不在每个源文件后重写整个索引）"""
+        with FrameCache._lock:
+            if FrameCache._index is not None and FrameCache._index_dirty:
+                FrameCache._save_index()
+                FrameCache._index_dirty = False
+
+    @staticmethod
+    def _entry_path(source_hash, spec):
+        """缓存条目路径"""
+        return FrameCache.get_cache_dir() / f"{source_hash}_{spec}_{FrameCache.PIXEL_FORMAT}.raw"
+
+    @staticmethod
+    def _count(hit):
+        """更新命中统计（解码线程池中并发调用，需要加锁）"""
+        with FrameCache._lock:
+            if hit:
+                FrameCache.hits += 1
+            else:
+                FrameCache.misses += 1
+
+    @staticmethod
+    def load(source_hash, spec):
+        """读取缓存条目，返回 (尺寸, 映射的像素内存)，不存在或损坏时返回None"""
+        entry_path = FrameCache._entry_path(source_hash, spec)
+        try:
+            with open(entry_path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            FrameCache._count(hit=False)
+            return None
+
+        magic, width, height = FrameCache.HEADER.unpack_from(mapped) if len(mapped) >= FrameCache.HEADER.size \
+            else (None, 0, 0)
+        if magic != FrameCache.MAGIC or len(mapped) != FrameCache.HEADER.size + width * height * 4:
+            print(f"⚠️  帧缓存条目损坏，将重新生成: {entry_path}")
+            mapped.close()
+            FrameCache._count(hit=False)
+            return None
+
+        FrameCache._count(hit=True)
+        # 像素内存视图持有mmap，表面构建完成后随视图一起释放
+        return (width, height), memoryview(mapped)[FrameCache.HEADER.size:]
+
+    @staticmethod
+    def store(source_hash, spec, size, pixels):
+        """写入缓存条目（先写临时文件再替换，避免读到半截数据）"""
+        entry_path = FrameCache._entry_path(source_hash, spec)
+        temp_path = entry_path.with_name(f"{entry_path.name}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(FrameCache.HEADER.pack(FrameCache.MAGIC, *size))
+                f.write(pixels)
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            print(f"⚠️  帧缓存写入失败 {entry_path}: {e}")
+
+
+# 正常退出时写回还没保存的索引改动
+atexit.register(FrameCache.flush)
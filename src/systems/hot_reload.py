@@ -0,0 +1,89 @@
+# src/systems/hot_reload.py
+"""开发用热重载 - 只重新解码修改过的动画帧"""
+
+import os
+from src.config.game_config import GameConfig
+from src.systems.resource_manager import ResourceManager
+from src.systems.asset_manifest import AssetManifest
+from src.systems.frame_cache import FrameCache
+
+
+class HotReloader:
+    """跟踪已加载动画帧文件的修改时间，帧之间分批检查，只重载改动过的帧"""
+
+    def __init__(self, animation_store, files_per_tick=GameConfig.HOT_RELOAD_FILES_PER_TICK):
+        self.animation_store = animation_store
+        self.files_per_tick = files_per_tick
+        self.mtimes = {}  # {帧文件路径: 修改时间}
+        self.owners = {}  # {帧文件路径: (状态, 帧序号)}
+        self.tracked_states = set()
+        self.queue = []  # 本轮还没检查的文件
+        self.reload_count = 0
+
+    def _track_loaded_states(self):
+        """开始跟踪新加载的动画状态的帧文件"""
+        for scene_type, status in list(self.animation_store.entries):
+            if status in self.tracked_states:
+                continue
+            self.tracked_states.add(status)
+            for index, file_path in enumerate(ResourceManager.get_frame_paths(status)):
+                try:
+                    self.mtimes[file_path] = os.stat(file_path).st_mtime_ns
+                    self.owners[file_path] = (status, index)
+                except FileNotFoundError:
+                    pass
+
+    def poll(self):
+        """检查一批文件，重载其中修改过的帧，返回本次重载的帧数"""
+        if not self.queue:
+            self._track_loaded_states()
+            self.queue = list(self.mtimes)
+
+        reloaded = 0
+        batch, self.queue = self.queue[:self.files_per_tick], self.queue[self.files_per_tick:]
+        for file_path in batch:
+            try:
+                mtime = os.stat(file_path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if mtime == self.mtimes[file_path]:
+                continue
+
+            # 文件已改动，清单中的校验和不再可信，帧缓存需要按新内容重新计算
+            manifest = AssetManifest.get()
+            if manifest:
+                manifest.mark_stale(ResourceManager.to_relative_path(file_path))
+            # 图集中这个状态的帧也已过期，被淘汰后重新加载时要读取新文件
+            atlas = ResourceManager.get_atlas()
+            if atlas:
+                atlas.mark_stale(self.owners[file_path][0])
+            if self._reload_frame(file_path, mtime):
+                reloaded += 1
+        return reloaded
+
+    def _reload_frame(self, file_path, mtime):
+        """重新解码一帧的所有场景尺寸，替换到仍在内存中的动画里
+
+        成功后才记录新的修改时间：编辑器可能还没写完文件，解码失败时下次检查会重试
+        """
+        status, index = self.owners[file_path]
+        loaded_scenes = [scene_type for scene_type in GameConfig.CAT_SCENE_SIZES
+                         if (scene_type, status) in self.animation_store.entries]
+        if not loaded_scenes:
+            self.mtimes[file_path] = mtime
+            return False  # 已被淘汰的状态下次按需加载时自然读取新文件
+
+        try:
+            decoded = ResourceManager.decode_frame(file_path, GameConfig.CAT_SCENE_SIZES)
+        except Exception as e:
+            print(f"❌ 热重载失败 {file_path}: {e}，下次检查时重试")
+            return False
+        self.mtimes[file_path] = mtime
+        FrameCache.flush()
+
+        for scene_type in loaded_scenes:
+            frame = ResourceManager.build_frame(*decoded[scene_type])
+            self.animation_store.replace_frame(scene_type, status, index, frame)
+        self.reload_count += 1
+        print(f"♻️ 热重载 {status} 第{index + 1}帧: {file_path.name}")
+        return True
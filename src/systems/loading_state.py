@@ -1,6 +1,7 @@
 # src/systems/loading_state.py
 """加载状态管理"""
 
+import time
 from src.config.game_config import GameConfig
 
 
@@ -13,6 +14,11 @@ class LoadingState:
         self.loading_frames = []
         self.is_loading_complete = False
 
+        # 增量加载流水线
+        self.pipeline = None  # 产出进度（0~1，等待后台任务时为None）的生成器
+        self.progress = 0.0
+        self.result = None
+
     def update(self):
         """更新加载动画"""
         self.animation_timer += 1
@@ -27,3 +33,39 @@ class LoadingState:
         if self.loading_frames and len(self.loading_frames) > 0:
             return self.loading_frames[self.frame_index]
         return None
+
+    def start(self, pipeline):
+        """开始一个增量加载流水线"""
+        self.pipeline = pipeline
+        self.progress = 0.0
+        self.result = None
+        self.is_loading_complete = False
+
+    def advance(self, budget_ms=GameConfig.LOADING_STEP_BUDGET_MS):
+        """在时间预算内推进加载流水线，返回是否已经加载完成"""
+        if self.pipeline is None or self.is_loading_complete:
+            return self.is_loading_complete
+
+        deadline = time.perf_counter() + budget_ms / 1000
+        try:
+            while time.perf_counter() < deadline:
+                progress = next(self.pipeline)
+                if progress is None:
+                    break  # 后台任务还在进行，下一帧再来
+                self.progress = progress
+        except StopIteration as done:
+            self.result = done.value
+            self.progress = 1.0
+            self.is_loading_complete = True
+            self.pipeline = None
+        return self.is_loading_complete
+
+    @staticmethod
+    def scale_progress(pipeline, start, end):
+        """把子流水线的进度映射到总进度的 [start, end] 区间，返回子流水线的结果"""
+        try:
+            while True:
+                progress = next(pipeline)
+                yield None if progress is None else start + (end - start) * progress
+        except StopIteration as done:
+            return done.value
@@ -2,15 +2,30 @@
 """资源管理器 - 修正路径问题"""
 
 import pygame
+import math
 import os
+import sys
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from src.config.game_config import GameConfig
 from src.config.animation_config import AnimationConfig
+from src.config.ui_layout import UILayout
+from src.systems.texture_atlas import TextureAtlas
+from src.systems.frame_cache import FrameCache
+from src.systems.asset_manifest import AssetManifest
+from src.systems.asset_pack import AssetPack
 
 
 class ResourceManager:
     """资源管理器 - 负责加载和管理所有游戏资源"""
 
+    # 最近一次 load_all_animations 每个动画状态的耗时（秒）
+    last_load_timings = {}
+    # 已加载的纹理图集（None表示未加载，False表示不可用）
+    _atlas = None
+
     @staticmethod
     def get_project_root():
         """获取项目根目录的绝对路径"""
@@ -19,6 +34,47 @@ class ResourceManager:
         project_root = current_file.parent.parent.parent  # 向上三级到项目根目录
         return project_root.resolve()  # 返回绝对路径
 
+    @staticmethod
+    def to_relative_path(file_path):
+        """把资源路径转换成清单中使用的相对项目根目录的路径"""
+        relative_path = os.path.relpath(file_path, ResourceManager.get_project_root())
+        return relative_path.replace(os.sep, "/")
+
+    @staticmethod
+    def asset_exists(file_path):
+        """资源是否存在：使用资源包时查包索引，有资源清单时查清单，否则检查文件系统"""
+        relative_path = ResourceManager.to_relative_path(file_path)
+        if not relative_path.startswith(".."):
+            index = AssetPack.get() or AssetManifest.get()
+            if index:
+                return index.has(relative_path)
+        return Path(file_path).exists()
+
+    @staticmethod
+    def get_asset_checksum(file_path):
+        """获取文件内容的校验和，文件不存在时返回None
+
+        使用资源包时取包索引里的校验和（读取的就是包里的数据）；磁盘上的文件不信任清单里的校验和
+        （清单快速检查只比较大小），由帧缓存索引按大小和修改时间核对，不一致时重新计算
+        """
+        relative_path = ResourceManager.to_relative_path(file_path)
+        pack = AssetPack.get()
+        if pack and not relative_path.startswith(".."):
+            checksum = pack.get_checksum(relative_path)
+            return checksum and FrameCache.source_hash(file_path, checksum)
+        if not Path(file_path).exists():
+            return None
+        return FrameCache.source_hash(file_path)
+
+    @staticmethod
+    def load_image_source(file_path):
+        """解码一张原始图片：使用资源包时直接从映射内存解码，否则从散装文件解码"""
+        pack = AssetPack.get()
+        relative_path = ResourceManager.to_relative_path(file_path)
+        if pack and pack.has(relative_path):
+            return pygame.image.load(pack.open_asset(relative_path), relative_path)
+        return pygame.image.load(str(file_path))
+
     @staticmethod
     def load_loading_animation():
         """加载loading动画"""
@@ -29,10 +85,14 @@ class ResourceManager:
         print(f"📁 项目根目录: {project_root}")
         print(f"📁 Loading路径: {loading_path}")
 
-        loading_frames = ResourceManager.load_png_frames(
-            str(loading_path), "load_frame_",
-            GameConfig.LOADING_FRAME_COUNT, GameConfig.LOADING_CAT_SIZE
-        )
+        atlas = ResourceManager.get_atlas()
+        if atlas:
+            loading_frames = atlas.get_frames("loading", "loading")
+        else:
+            loading_frames = ResourceManager.load_png_frames(
+                str(loading_path), "load_frame_",
+                GameConfig.LOADING_FRAME_COUNT, GameConfig.LOADING_CAT_SIZE
+            )
         if loading_frames:
             print(f"✅ Loading动画加载成功：{len(loading_frames)}帧")
             return loading_frames
@@ -40,95 +100,391 @@ class ResourceManager:
             print("❌ Loading动画加载失败")
             return []
 
+    @staticmethod
+    def get_atlas():
+        """获取纹理图集（只加载一次），未启用或未烘焙时返回None"""
+        if ResourceManager._atlas is None:
+            atlas = TextureAtlas.load() if GameConfig.USE_TEXTURE_ATLAS else None
+            ResourceManager._atlas = atlas or False
+        return ResourceManager._atlas or None
+
     @staticmethod
     def load_png_frames(folder, prefix, frame_count, target_size):
         """安全地加载PNG动画帧序列，带错误处理"""
-        frames = []
+        return ResourceManager.load_png_frames_multi(
+            folder, prefix, frame_count, {"frames": target_size})["frames"]
+
+    @staticmethod
+    def load_png_frames_multi(folder, prefix, frame_count, size_bank):
+        """加载PNG动画帧序列，每帧只解码一次，缩放出 size_bank 中的所有尺寸
+
+        size_bank: {场景名: 目标尺寸}，返回 {场景名: 帧列表}
+        """
+        bank = {scene_type: [] for scene_type in size_bank}
         folder_path = Path(folder)
         print(f"🔄 加载动画：{folder_path}")
-        print(f"📁 文件夹是否存在: {folder_path.exists()}")
 
-        if not folder_path.exists():
+        if not (AssetPack.get() or AssetManifest.get()) and not folder_path.exists():
             print(f"❌ 文件夹不存在: {folder_path}")
-            return frames
+            return bank
 
-        # 列出文件夹中的所有文件进行调试
-        all_files = list(folder_path.glob("*.png"))
-        print(f"📄 文件夹中的PNG文件: {[f.name for f in all_files]}")
-
-        for i in range(1, frame_count + 1):
-            filename = f"{prefix}{i:02d}.png"
-            file_path = folder_path / filename
+        for file_path in ResourceManager._list_frame_paths(folder_path, prefix, frame_count):
             print(f"🔍 尝试加载: {file_path}")
-
             try:
-                if not file_path.exists():
-                    print(f"❌ 文件不存在: {file_path}")
-                    continue
-
-                # 加载图片
-                img = pygame.image.load(str(file_path)).convert_alpha()
-                # 等比例缩放
-                orig_w, orig_h = img.get_size()
-                scale = min(target_size / orig_w, target_size / orig_h)
-                new_size = (int(orig_w * scale), int(orig_h * scale))
-                frame_image = pygame.transform.scale(img, new_size)
-                frames.append(frame_image)
-                print(f"✅ 成功加载: {filename}")
+                decoded = ResourceManager.decode_frame(file_path, size_bank)
+                for scene_type, (size, pixels) in decoded.items():
+                    bank[scene_type].append(ResourceManager.build_frame(size, pixels))
+                print(f"✅ 成功加载: {file_path.name}")
             except pygame.error as e:
                 print(f"❌ Pygame错误 {file_path}: {e}")
             except Exception as e:
                 print(f"❌ 其他错误 {file_path}: {e}")
+        FrameCache.flush()
 
-        print(f"✅ 总共加载了{len(frames)}帧动画")
-        return frames
+        print(f"✅ 总共加载了{len(next(iter(bank.values()), []))}帧动画")
+        return bank
 
     @staticmethod
-    def load_all_animations():
-        """加载所有动画，为主场景和房间分别加载不同大小"""
-        animations = {"main": {}, "room": {}}
-        print("开始加载所有动画")
+    def get_animation_folder(status):
+        """获取某个动画状态所在的文件夹"""
+        config = AnimationConfig.ANIMATION[status]
         project_root = ResourceManager.get_project_root()
+        # 根据动画类型选择不同的基础路径
+        if status == "loading":
+            return project_root / "assets" / "animations" / config['folder']
+        return project_root / "assets" / "animations" / "cat" / config['folder']
 
-        for status, config in AnimationConfig.ANIMATION.items():
-            # 根据动画类型选择不同的基础路径
-            if status == "loading":
-                folder_path = project_root / "assets" / "animations" / config['folder']
+    @staticmethod
+    def _list_frame_paths(folder_path, prefix, frame_count):
+        """按命名规则列出所有存在的帧文件路径"""
+        frame_paths = []
+        for i in range(1, frame_count + 1):
+            file_path = folder_path / f"{prefix}{i:02d}.png"
+            if ResourceManager.asset_exists(file_path):
+                frame_paths.append(file_path)
             else:
-                folder_path = project_root / "assets" / "animations" / "cat" / config['folder']
+                print(f"❌ 文件不存在: {file_path}")
+        return frame_paths
 
-            print(f"🔄 处理动画: {status}, 路径: {folder_path}")
+    @staticmethod
+    def get_frame_paths(status):
+        """获取某个动画状态所有存在的帧文件路径"""
+        config = AnimationConfig.ANIMATION[status]
+        folder_path = ResourceManager.get_animation_folder(status)
+        return ResourceManager._list_frame_paths(folder_path, config["prefix"], config["count"])
 
-            main_frames = ResourceManager.load_png_frames(
-                str(folder_path),
-                config["prefix"],
-                config["count"],
-                GameConfig.CAT_TARGET_SIZE
-            )
+    @staticmethod
+    def scale_to_fit(img, target_size):
+        """等比例缩放到 target_size 见方的范围内"""
+        orig_w, orig_h = img.get_size()
+        scale = min(target_size / orig_w, target_size / orig_h)
+        new_size = (int(orig_w * scale), int(orig_h * scale))
+        return pygame.transform.scale(img, new_size)
 
-            # 房间加载小尺寸猫
-            room_frames = ResourceManager.load_png_frames(
-                str(folder_path),
-                config["prefix"],
-                config["count"],
-                GameConfig.CAT_ROOM_SIZE
-            )
+    @staticmethod
+    def _scale_image(img, target):
+        """按目标规格缩放：整数为等比例缩放到见方范围内，元组为精确尺寸，None为原尺寸"""
+        if target is None:
+            return img
+        if isinstance(target, tuple):
+            return pygame.transform.scale(img, target)
+        return ResourceManager.scale_to_fit(img, target)
+
+    @staticmethod
+    def _cache_spec(target):
+        """目标规格在帧缓存中的键"""
+        if target is None:
+            return "orig"
+        if isinstance(target, tuple):
+            return f"{target[0]}x{target[1]}"
+        return f"fit{target}"
+
+    @staticmethod
+    def decode_image(file_path, targets):
+        """读取并解码一张图片，从同一次解码缩放出所有目标规格（不依赖显示模式，可在工作线程中调用）
+
+        targets: {键: 目标规格}，返回 {键: (尺寸, 原始RGBA像素)}；
+        启用帧缓存时优先从缓存映射，全部命中则完全跳过解码和缩放
+        """
+        source_hash = None
+        if GameConfig.USE_FRAME_CACHE:
+            # 资源包直接使用包里的校验和，磁盘文件按大小和修改时间核对后才复用记录的哈希
+            source_hash = ResourceManager.get_asset_checksum(file_path)
+        if source_hash:
+            cached = {key: FrameCache.load(source_hash, ResourceManager._cache_spec(target))
+                      for key, target in targets.items()}
+            if all(cached.values()):
+                return cached
+
+        img = ResourceManager.load_image_source(file_path)
+        decoded = {}
+        for key, target in targets.items():
+            scaled = ResourceManager._scale_image(img, target)
+            decoded[key] = (scaled.get_size(), pygame.image.tobytes(scaled, "RGBA"))
+            if source_hash:
+                FrameCache.store(source_hash, ResourceManager._cache_spec(target), *decoded[key])
+        return decoded
+
+    @staticmethod
+    def decode_frame(file_path, size_bank):
+        """读取并解码单帧，从同一次解码缩放出所有尺寸
+
+        返回 {场景名: (尺寸, 原始RGBA像素)}
+        """
+        return ResourceManager.decode_image(file_path, size_bank)
+
+    @staticmethod
+    def has_display():
+        """是否已经设置了显示模式（无头模式下没有窗口，不能 convert_alpha）"""
+        return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+    @staticmethod
+    def to_display_format(surface):
+        """有显示模式时转换成显示格式；无头模式下原样返回中立的32位RGBA表面"""
+        if not ResourceManager.has_display() or surface.get_bitsize() == 8:
+            return surface  # 调色板表面本身就是紧凑存储，不转换
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    @staticmethod
+    def convert_resources(resources):
+        """把无头模式加载的资源（表面或嵌套的字典/列表）转换成显示格式，没有显示模式时原样返回
+
+        列表原地替换元素，共享同一帧列表的备用动画一起转换
+        """
+        if isinstance(resources, pygame.Surface):
+            return ResourceManager.to_display_format(resources)
+        if isinstance(resources, dict):
+            for key, value in resources.items():
+                resources[key] = ResourceManager.convert_resources(value)
+        elif isinstance(resources, list):
+            converted = {}
+            for i, value in enumerate(resources):
+                if id(value) not in converted:
+                    converted[id(value)] = ResourceManager.convert_resources(value)
+                resources[i] = converted[id(value)]
+        return resources
+
+    @staticmethod
+    def build_surface(size, pixels):
+        """在主线程中把原始RGBA像素构建成最终的表面
+
+        有显示模式时转换成显示格式；无头模式下复制成独立的32位RGBA表面（不再引用帧缓存的映射内存）
+        """
+        if ResourceManager.has_display():
+            return pygame.image.frombuffer(pixels, size, "RGBA").convert_alpha()
+        return pygame.image.frombytes(bytes(pixels), size, "RGBA")
 
-            if main_frames and room_frames:
-                animations["main"][status] = main_frames
-                animations["room"][status] = room_frames
-                print(f"✅ {status}动画加载成功 - 主场景：{len(main_frames)}帧, 房间：{len(room_frames)}帧")
+    @staticmethod
+    def build_frame(size, pixels):
+        """构建一帧动画表面，开启紧凑存储时转换成调色板或RLE表面"""
+        frame = ResourceManager.build_surface(size, pixels)
+        if GameConfig.COMPACT_FRAMES:
+            frame, _ = ResourceManager.compact_surface(frame)
+        return frame
+
+    @staticmethod
+    def compact_surface(surface):
+        """在无损的前提下把像素画帧转换成更紧凑的表面，返回 (表面, 模式)
+
+        - "palette": 透明度只有全透明/不透明且不超过255种颜色，转成8位调色板表面 + RLE色键
+        - "rle": 透明度只有全透明/不透明但颜色较多，转成无逐像素透明度的表面 + RLE色键
+        - None: 有半透明像素，保持原样
+        """
+        size = surface.get_size()
+        colors = array("I", pygame.image.tobytes(surface, "RGBA"))
+        opaque = set()
+        has_transparent = False
+        for color in set(colors):
+            rgba = color.to_bytes(4, sys.byteorder)
+            if rgba[3] == 0:
+                has_transparent = True
+            elif rgba[3] == 255:
+                opaque.add(color)
             else:
-                print(f"⚠️  {status}动画加载失败，将使用默认动画")
+                return surface, None
+
+        # 找一个帧里没有用到的颜色作为透明色键
+        opaque_rgb = {color.to_bytes(4, sys.byteorder)[:3] for color in opaque}
+        key_rgb = next(bytes(rgb) for rgb in ((255, 0, 255), (0, 255, 0), (0, 255, 255), (1, 2, 3))
+                       if bytes(rgb) not in opaque_rgb)
+
+        if len(opaque) < 256:
+            palette = [tuple(key_rgb)] + [tuple(color.to_bytes(4, sys.byteorder)[:3]) for color in opaque]
+            index_map = {color: i + 1 for i, color in enumerate(opaque)}
+            indices = bytes(index_map.get(color, 0) for color in colors)
+            compact = pygame.image.frombytes(indices, size, "P")
+            compact.set_palette(palette)
+            if has_transparent:
+                compact.set_colorkey(0, pygame.RLEACCEL)
+            return compact, "palette"
+
+        compact = pygame.Surface(size)
+        compact.fill(tuple(key_rgb))
+        compact.blit(surface, (0, 0))
+        if has_transparent:
+            compact.set_colorkey(tuple(key_rgb), pygame.RLEACCEL)
+        return compact, "rle"
+
+    @staticmethod
+    def _decode_state(status, size_bank):
+        """解码一个动画状态的所有帧，返回(每帧的多尺寸像素列表, 耗时秒数)
+
+        内容相同的帧（像素画动画里的停顿帧）只解码一次，列表中共享同一份解码结果
+        """
+        start = time.perf_counter()
+        decoded = []
+        seen = {}  # {校验和: 解码结果}
+        for file_path in ResourceManager.get_frame_paths(status):
+            checksum = ResourceManager.get_asset_checksum(file_path)
+            if checksum in seen:
+                decoded.append(seen[checksum])
+                continue
+            try:
+                frame = ResourceManager.decode_frame(file_path, size_bank)
+            except pygame.error as e:
+                print(f"❌ Pygame错误 {file_path}: {e}")
+                continue
+            except Exception as e:
+                print(f"❌ 其他错误 {file_path}: {e}")
+                continue
+            decoded.append(frame)
+            if checksum:
+                seen[checksum] = frame
+        return decoded, time.perf_counter() - start
+
+    @staticmethod
+    def build_state_frames(decoded, scene_type):
+        """把一个动画状态的解码结果构建成帧表面，共享的解码结果对应同一个表面"""
+        built = {}
+        frames = []
+        for frame in decoded:
+            if id(frame) not in built:
+                built[id(frame)] = ResourceManager.build_frame(*frame[scene_type])
+            frames.append(built[id(frame)])
+        return frames
+
+    @staticmethod
+    def run_to_completion(loader):
+        """一次性跑完一个增量加载生成器，返回它的结果"""
+        try:
+            while True:
+                next(loader)
+        except StopIteration as done:
+            return done.value
+
+    @staticmethod
+    def load_all_animations(workers=None):
+        """加载所有动画，每帧解码一次，为主场景和房间分别缩放出不同大小
+
+        workers: 解码线程数，默认取 GameConfig.LOADER_WORKERS；<=1 时在主线程顺序加载
+        """
+        return ResourceManager.run_to_completion(ResourceManager.iter_load_all_animations(workers, blocking=True))
 
+    @staticmethod
+    def iter_load_all_animations(workers=None, blocking=False):
+        """增量加载所有动画的生成器
+
+        每处理完一个动画状态产出一次进度（0~1），等待后台解码线程时产出None；
+        生成器结束时返回动画字典（失败时为None）
+        blocking: 一次性跑完时直接阻塞等待解码线程，不空转让出（加载界面按帧推进时为False）
+        """
+        atlas = ResourceManager.get_atlas()
+        if atlas:
+            return ResourceManager.load_animations_from_atlas(atlas)
+
+        if workers is None:
+            workers = GameConfig.LOADER_WORKERS or os.cpu_count() or 1
+
+        size_bank = GameConfig.CAT_SCENE_SIZES
+        animations = {scene_type: {} for scene_type in size_bank}
+        timings = {}
+        print(f"开始加载所有动画（解码线程数：{workers}）")
+        load_start = time.perf_counter()
+
+        pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            # 并行模式下先把所有解码任务提交给线程池
+            jobs = {}
+            if pool:
+                for status in AnimationConfig.ANIMATION:
+                    jobs[status] = pool.submit(ResourceManager._decode_state, status, size_bank)
+
+            for done_count, status in enumerate(AnimationConfig.ANIMATION):
+                print(f"🔄 处理动画: {status}, 路径: {ResourceManager.get_animation_folder(status)}")
+                if pool:
+                    # 后台线程还没解码完时让出控制权，不阻塞主循环
+                    while not blocking and not jobs[status].done():
+                        yield None
+                    decoded, decode_time = jobs[status].result()
+                else:
+                    decoded, decode_time = ResourceManager._decode_state(status, size_bank)
+
+                build_start = time.perf_counter()
+                for scene_type in size_bank:
+                    frames = ResourceManager.build_state_frames(decoded, scene_type)
+                    if frames:
+                        animations[scene_type][status] = frames
+                build_time = time.perf_counter() - build_start
+
+                timings[status] = {"decode": decode_time, "build": build_time}
+                print(f"⏱️ {status}: 解码 {decode_time * 1000:.1f}ms, 构建表面 {build_time * 1000:.1f}ms")
+
+                if decoded:
+                    print(f"✅ {status}动画加载成功 - " +
+                          ", ".join(f"{scene_type}：{len(decoded)}帧" for scene_type in size_bank))
+                else:
+                    print(f"⚠️  {status}动画加载失败，将使用默认动画")
+                yield (done_count + 1) / len(AnimationConfig.ANIMATION)
+        finally:
+            if pool:
+                pool.shutdown()
+
+        FrameCache.flush()
+        ResourceManager.last_load_timings = timings
+        print(f"⏱️ 动画加载总耗时 {(time.perf_counter() - load_start) * 1000:.1f}ms（解码线程数：{workers}）")
+        return ResourceManager._fill_missing_animations(animations)
+
+    @staticmethod
+    def load_animations_from_atlas(atlas):
+        """从纹理图集分发所有动画帧（子表面，不再读取散装图片）"""
+        print("开始从纹理图集加载所有动画")
+        animations = {scene_type: {} for scene_type in GameConfig.CAT_SCENE_SIZES}
+        for scene_type in animations:
+            for status in AnimationConfig.ANIMATION:
+                frames = atlas.get_frames(scene_type, status)
+                if frames:
+                    animations[scene_type][status] = frames
+        return ResourceManager._fill_missing_animations(animations)
+
+    @staticmethod
+    def load_state_bank(status):
+        """只加载一个动画状态（按需加载时使用），每帧解码一次，缩放出所有场景尺寸
+
+        返回 {场景名: 帧列表}
+        """
+        size_bank = GameConfig.CAT_SCENE_SIZES
+        atlas = ResourceManager.get_atlas()
+        if atlas and atlas.has_current(status):
+            return {scene_type: atlas.get_frames(scene_type, status) for scene_type in size_bank}
+
+        decoded, decode_time = ResourceManager._decode_state(status, size_bank)
+        FrameCache.flush()
+        bank = {scene_type: ResourceManager.build_state_frames(decoded, scene_type) for scene_type in size_bank}
+        print(f"⏱️ 按需加载 {status}: {len(decoded)}帧 × {len(size_bank)}种尺寸, 解码 {decode_time * 1000:.1f}ms")
+        return bank
+
+    @staticmethod
+    def _fill_missing_animations(animations):
+        """检查normal动画并用它替代加载失败的动画"""
         # 确保至少有normal动画，否则游戏无法运行
-        if ("normal" not in animations["main"] or not animations["main"]["normal"] or
-                "normal" not in animations["room"] or not animations["room"]["normal"]):
+        if any(not animations[scene_type].get("normal") for scene_type in animations):
             print("❌ 关键错误：无法加载normal动画，游戏无法启动")
             return None
 
         # 用normal动画作为所有失败动画的备用
-        for scene_type in ["main", "room"]:
+        for scene_type in animations:
             for status in AnimationConfig.ANIMATION.keys():
                 if status not in animations[scene_type] or not animations[scene_type][status]:
                     animations[scene_type][status] = animations[scene_type]["normal"]
@@ -140,6 +496,11 @@ class ResourceManager:
     @staticmethod
     def load_ui_images():
         """加载所有UI相关图片"""
+        return ResourceManager.run_to_completion(ResourceManager.iter_load_ui_images())
+
+    @staticmethod
+    def iter_load_ui_images():
+        """增量加载UI图片的生成器，每加载一张产出一次进度，结束时返回图片字典（失败时为None）"""
         print("🔄 开始加载UI图片...")
         project_root = ResourceManager.get_project_root()
         ui_images = {}
@@ -152,24 +513,31 @@ class ResourceManager:
             "right_button": "assets/images/ui/right_arrow.png",
             "left_button": "assets/images/ui/left_arrow.png"
         }
+        for prefix in ("health_bar", "mood_bar"):
+            for percent in UILayout.PROGRESS_BAR_PERCENTS:
+                image_files[f"{prefix}_{percent}"] = f"assets/images/ui/progress_bars/{prefix}_{percent}.png"
 
         for name, relative_path in image_files.items():
             full_path = project_root / relative_path
             print(f"🔍 尝试加载: {full_path}")
 
             try:
-                if not full_path.exists():
+                if not ResourceManager.asset_exists(full_path):
                     print(f"❌ 文件不存在: {full_path}")
                     return None
 
-                img = pygame.image.load(str(full_path)).convert_alpha()
                 # 处理不同类型的图片
                 if name == "main_background":
-                    img = pygame.transform.scale(img, GameConfig.MAIN_WINDOW_SIZE)
+                    target = GameConfig.MAIN_WINDOW_SIZE
                 elif name == "room_background":
-                    img = pygame.transform.scale(img, GameConfig.ROOM_WINDOW_SIZE)
+                    target = GameConfig.ROOM_WINDOW_SIZE
                 elif "button" in name:
-                    img = pygame.transform.scale(img, GameConfig.BUTTON_SIZE)
+                    target = GameConfig.BUTTON_SIZE
+                elif "_bar_" in name:
+                    target = UILayout.PROGRESS_BAR_SIZE
+                else:
+                    target = None
+                img = ResourceManager.build_surface(*ResourceManager.decode_image(full_path, {name: target})[name])
 
                 ui_images[name] = img
                 print(f"✅ 加载图片成功: {relative_path}")
@@ -179,6 +547,28 @@ class ResourceManager:
             except Exception as e:
                 print(f"❌ 其他错误 {full_path}: {e}")
                 return None
+            yield len(ui_images) / len(image_files)
+
+        # 连续进度条使用的空槽
+        for prefix in ("health_bar", "mood_bar"):
+            lowest = ui_images[f"{prefix}_{UILayout.PROGRESS_BAR_PERCENTS[0]}"]
+            ui_images[f"{prefix}_track"] = ResourceManager.build_progress_bar_track(lowest)
+        FrameCache.flush()
 
         print("✅ 所有UI图片加载完成！")
         return ui_images
+
+    @staticmethod
+    def build_progress_bar_track(lowest_bar):
+        """从最低档进度条图片生成空槽：用空槽位置的一列像素覆盖整个填充区"""
+        width, height = lowest_bar.get_size()
+        start, end = UILayout.PROGRESS_BAR_FILL_SPAN
+        fill_start, fill_end = int(width * start), math.ceil(width * end)
+        empty_x = int(width * UILayout.PROGRESS_BAR_EMPTY_X)
+
+        pixels = bytearray(pygame.image.tobytes(lowest_bar, "RGBA"))
+        for y in range(height):
+            row = y * width * 4
+            empty_pixel = pixels[row + empty_x * 4:row + empty_x * 4 + 4]
+            pixels[row + fill_start * 4:row + fill_end * 4] = empty_pixel * (fill_end - fill_start)
+        return ResourceManager.build_surface((width, height), bytes(pixels))
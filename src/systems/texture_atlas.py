@@ -0,0 +1,222 @@
+# src/systems/texture_atlas.py
+"""纹理图集 - 把所有动画帧打包成少量大图"""
+
+import hashlib
+import json
+import pygame
+from src.config.game_config import GameConfig
+from src.config.animation_config import AnimationConfig
+
+
+class TextureAtlas:
+    """纹理图集：烘焙时打包所有帧，运行时只解码图集并以子表面形式分发帧"""
+    INDEX_VERSION = 2
+
+    def __init__(self, pages, frames):
+        self.pages = pages  # 图集页表面列表
+        self.frames = frames  # {"场景/状态": [(页号, x, y, w, h), ...]}
+        self.display_ready = False  # 图集页是否已转换成显示格式（无头模式加载时为False）
+        self.stale_states = set()  # 运行中源文件被改动（热重载）的状态，不再从图集分发
+
+    @staticmethod
+    def get_atlas_dir():
+        """图集输出目录"""
+        from src.systems.resource_manager import ResourceManager
+        return ResourceManager.get_project_root() / GameConfig.ATLAS_DIR
+
+    @staticmethod
+    def get_size_banks():
+        """每个动画状态需要烘焙的尺寸：猫咪按场景尺寸，loading额外烘焙加载界面尺寸"""
+        banks = {}
+        for status in AnimationConfig.ANIMATION:
+            banks[status] = dict(GameConfig.CAT_SCENE_SIZES)
+        banks["loading"]["loading"] = GameConfig.LOADING_CAT_SIZE
+        return banks
+
+    @staticmethod
+    def get_source_info(file_path):
+        """记录一个源帧文件的版本：资源包中的文件用包内校验和，散装文件额外记录大小和修改时间"""
+        from src.systems.resource_manager import ResourceManager
+        from src.systems.asset_pack import AssetPack
+        pack = AssetPack.get()
+        relative_path = ResourceManager.to_relative_path(file_path)
+        if pack and pack.has(relative_path):
+            return {"sha1": pack.get_checksum(relative_path)}
+        stat = file_path.stat()
+        with open(file_path, 'rb') as f:
+            checksum = hashlib.sha1(f.read()).hexdigest()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": checksum}
+
+    @staticmethod
+    def is_source_current(file_path, info):
+        """源帧文件是否和烘焙时相同：大小和修改时间都没变时不读文件，否则比较校验和"""
+        from src.systems.resource_manager import ResourceManager
+        from src.systems.asset_pack import AssetPack
+        pack = AssetPack.get()
+        relative_path = ResourceManager.to_relative_path(file_path)
+        if pack and pack.has(relative_path):
+            return pack.get_checksum(relative_path) == info["sha1"]
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return False
+        if stat.st_size == info.get("size") and stat.st_mtime_ns == info.get("mtime_ns"):
+            return True
+        with open(file_path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest() == info["sha1"]
+
+    @staticmethod
+    def find_stale_sources(sources):
+        """和当前的帧文件比较，返回新增、删除或内容改动的源文件列表"""
+        from src.systems.resource_manager import ResourceManager
+        current = {ResourceManager.to_relative_path(file_path): file_path
+                   for status in AnimationConfig.ANIMATION
+                   for file_path in ResourceManager.get_frame_paths(status)}
+        stale = sorted(set(current) ^ set(sources))
+        stale += [relative_path for relative_path, file_path in current.items()
+                  if relative_path in sources and not TextureAtlas.is_source_current(file_path, sources[relative_path])]
+        return stale
+
+    @staticmethod
+    def _pack(frame_sizes, max_size, padding):
+        """货架式装箱：按高度从高到低逐行摆放，放不下时换新页
+
+        frame_sizes: [(key, (w, h)), ...]，返回 ({key: (页号, x, y)}, 每页尺寸列表)
+        """
+        placements = {}
+        page_sizes = []
+        page, x, y, shelf_h, page_w = 0, 0, 0, 0, 0
+
+        for key, (w, h) in sorted(frame_sizes, key=lambda item: item[1][1], reverse=True):
+            if x + w > max_size:
+                # 换行
+                x, y, shelf_h = 0, y + shelf_h + padding, 0
+            if y + h > max_size:
+                # 换页
+                page_sizes.append((page_w, y))
+                page, x, y, shelf_h, page_w = page + 1, 0, 0, 0, 0
+            placements[key] = (page, x, y)
+            x += w + padding
+            shelf_h = max(shelf_h, h)
+            page_w = max(page_w, x)
+        page_sizes.append((page_w, y + shelf_h))
+        return placements, page_sizes
+
+    @staticmethod
+    def bake(output_dir=None):
+        """把 AnimationConfig 中所有状态的所有尺寸帧打包成图集页和索引文件"""
+        from src.systems.resource_manager import ResourceManager
+        output_dir = output_dir or TextureAtlas.get_atlas_dir()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        print(f"🔄 开始烘焙纹理图集 -> {output_dir}")
+
+        # 每帧解码一次，缩放出所有需要的尺寸；内容相同的帧只打包一次
+        images = {}
+        aliases = {}  # {(组, 帧序号): 内容相同的前一帧序号}
+        sources = {}  # {源文件相对路径: 版本信息}，加载时据此判断图集是否过期
+        for status, size_bank in TextureAtlas.get_size_banks().items():
+            seen = {}  # {校验和: 帧序号}
+            for index, file_path in enumerate(ResourceManager.get_frame_paths(status)):
+                sources[ResourceManager.to_relative_path(file_path)] = TextureAtlas.get_source_info(file_path)
+                checksum = ResourceManager.get_asset_checksum(file_path)
+                if checksum in seen:
+                    for scene_type in size_bank:
+                        aliases[f"{scene_type}/{status}", index] = seen[checksum]
+                    continue
+                if checksum:
+                    seen[checksum] = index
+                img = ResourceManager.load_image_source(file_path)
+                for scene_type, target_size in size_bank.items():
+                    images[f"{scene_type}/{status}", index] = ResourceManager.scale_to_fit(img, target_size)
+
+        padding = GameConfig.ATLAS_PADDING
+        placements, page_sizes = TextureAtlas._pack(
+            [(key, img.get_size()) for key, img in images.items()], GameConfig.ATLAS_MAX_SIZE, padding)
+
+        pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+        for (group, index), img in images.items():
+            page, x, y = placements[group, index]
+            pages[page].blit(img, (x, y))
+
+        frames = {}
+        for group, index in sorted([*images, *aliases]):
+            source_index = aliases.get((group, index), index)
+            page, x, y = placements[group, source_index]
+            frames.setdefault(group, []).append([page, x, y, *images[group, source_index].get_size()])
+
+        page_files = []
+        for page, surface in enumerate(pages):
+            filename = f"atlas_{page}.png"
+            pygame.image.save(surface, str(output_dir / filename))
+            page_files.append(filename)
+
+        index = {
+            "version": TextureAtlas.INDEX_VERSION,
+            "size_banks": TextureAtlas.get_size_banks(),
+            "pages": page_files,
+            "frames": frames,
+            "sources": sources
+        }
+        with open(output_dir / GameConfig.ATLAS_INDEX_FILE, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, ensure_ascii=False)
+
+        print(f"✅ 图集烘焙完成：{len(images)}帧 -> {len(pages)}页 {page_sizes}")
+        return index
+
+    @staticmethod
+    def load(atlas_dir=None):
+        """加载图集：每页只解码一次，失败或与当前配置不符时返回None"""
+        from src.systems.resource_manager import ResourceManager
+        atlas_dir = atlas_dir or TextureAtlas.get_atlas_dir()
+        index_path = atlas_dir / GameConfig.ATLAS_INDEX_FILE
+        if not index_path.exists():
+            return None
+
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if (index.get("version") != TextureAtlas.INDEX_VERSION or
+                    index.get("size_banks") != TextureAtlas.get_size_banks()):
+                print("⚠️  纹理图集与当前配置不一致，请重新烘焙，先使用散装图片")
+                return None
+            stale = TextureAtlas.find_stale_sources(index["sources"])
+            if stale:
+                print(f"⚠️  纹理图集已过期（{len(stale)}个帧文件有改动，例如 {stale[:3]}），"
+                      f"请运行 python -m src.utilis.bake_atlas 重新烘焙，先使用散装图片")
+                return None
+
+            pages = [ResourceManager.to_display_format(pygame.image.load(str(atlas_dir / filename)))
+                     for filename in index["pages"]]
+            print(f"✅ 纹理图集加载成功：{len(pages)}页")
+            atlas = TextureAtlas(pages, index["frames"])
+            atlas.display_ready = ResourceManager.has_display()
+            return atlas
+        except pygame.error as e:
+            print(f"❌ Pygame错误 {index_path}: {e}")
+        except Exception as e:
+            print(f"❌ 图集加载失败 {index_path}: {e}")
+        return None
+
+    def mark_stale(self, status):
+        """运行中某个状态的帧文件被改动，之后按需加载时改为解码散装图片"""
+        self.stale_states.add(status)
+
+    def has_current(self, status):
+        """图集中这个状态的帧是否仍是最新的"""
+        return status not in self.stale_states
+
+    def get_frames(self, scene_type, status):
+        """获取某个场景尺寸下某个状态的所有帧（图集页的子表面）"""
+        from src.systems.resource_manager import ResourceManager
+        if not self.display_ready and ResourceManager.has_display():
+            # 无头模式加载的图集页在有显示模式后转换一次
+            self.pages = [ResourceManager.to_display_format(page) for page in self.pages]
+            self.display_ready = True
+        # 内容相同的帧在图集中是同一块区域，共享同一个子表面
+        subsurfaces = {}
+        frames = []
+        for page, x, y, w, h in self.frames.get(f"{scene_type}/{status}", []):
+            if (page, x, y) not in subsurfaces:
+                subsurfaces[page, x, y] = self.pages[page].subsurface((x, y, w, h))
+            frames.append(subsurfaces[page, x, y])
+        return frames
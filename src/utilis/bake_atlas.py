@@ -0,0 +1,18 @@
+# src/utilis/bake_atlas.py
+"""纹理图集烘焙命令：python -m src.utilis.bake_atlas"""
+
+import os
+import pygame
+from src.systems.texture_atlas import TextureAtlas
+
+
+def main():
+    """烘焙所有动画帧到 assets/atlas"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    TextureAtlas.bake()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
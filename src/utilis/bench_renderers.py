@@ -0,0 +1,139 @@
+# src/utilis/bench_renderers.py
+"""渲染器基准测试：python -m src.utilis.bench_renderers [--update-golden]
+
+用固定的猫咪状态在虚拟显示驱动上逐个运行渲染器，输出每次调用的耗时和绘制命令数，
+并把整帧画面和基准画面逐像素比较，防止缓存之类的优化悄悄改变画面。
+基准画面依赖本机字体，不提交到仓库：优化前先用 --update-golden 生成，优化后再运行比较。
+"""
+
+import os
+import sys
+import time
+import pygame
+from src.config.game_config import GameConfig
+from src.core.game_time import GameTime
+from src.core.cat_state import CatState
+from src.core.offscreen import OffscreenRenderer
+from src.systems.resource_manager import ResourceManager
+from src.renderer.ui_renderer import UIRenderer
+from src.renderer.cat_renderer import CatRenderer
+from src.renderer.effect_renderer import EffectRenderer
+from src.renderer.render_queue import RenderQueue
+
+
+def make_fixtures():
+    """固定的游戏状态：{名称: (场景, 猫咪状态, 游戏时间)}"""
+    fixtures = {}
+
+    game_time = GameTime()
+    fixtures["main_idle"] = ("main", CatState(game_time), game_time)
+
+    game_time = GameTime()
+    cat_state = CatState(game_time)
+    cat_state.health, cat_state.mood = 25, 45
+    cat_state.current_needs = ["hungry", "play"]
+    cat_state.status = "hungry"
+    cat_state.play_time = 3725
+    fixtures["main_needs"] = ("main", cat_state, game_time)
+
+    game_time = GameTime()
+    cat_state = CatState(game_time)
+    cat_state.current_needs = ["touch"]
+    cat_state.touch_system.touch_progress = 60
+    cat_state.last_save_message = "Saved"
+    cat_state.save_message_timer = 30
+    fixtures["main_touch_saved"] = ("main", cat_state, game_time)
+
+    game_time = GameTime()
+    game_time.current_hour = 22
+    cat_state = CatState(game_time)
+    cat_state.health, cat_state.mood = 70, 10
+    cat_state.current_needs = ["sleepy"]
+    cat_state.status = "sleepy"
+    cat_state.room_x, cat_state.room_y = 150, 200
+    cat_state.prev_room_x, cat_state.prev_room_y = 140, 195
+    fixtures["room_night"] = ("room", cat_state, game_time)
+    return fixtures
+
+
+def get_renderers(renderer):
+    """被测渲染器：{名称: 以渲染队列为参数的调用}"""
+    return {
+        "CatRenderer.draw_cat": lambda queue: CatRenderer.draw_cat(
+            queue, renderer.cat_animation, renderer.cat_state, renderer.scene),
+        "UIRenderer.draw_fixed_ui": lambda queue: UIRenderer.draw_fixed_ui(
+            queue, renderer.ui_images, renderer.cat_state, renderer.scene),
+        "UIRenderer.draw_time_display": lambda queue: UIRenderer.draw_time_display(queue, renderer.game_time),
+        "UIRenderer.draw_game_info": lambda queue: UIRenderer.draw_game_info(queue, renderer.cat_state),
+        "UIRenderer.draw_save_message": lambda queue: UIRenderer.draw_save_message(queue, renderer.cat_state),
+        "EffectRenderer.draw_need_clouds": lambda queue: EffectRenderer.draw_need_clouds(
+            queue, renderer.ui_images["cloud"], renderer.cat_state, renderer.scene),
+    }
+
+
+def bench(renderer, draw, repeats):
+    """测量一个渲染器平均每次调用的耗时（微秒，含提交）和绘制命令数"""
+    queue = RenderQueue()
+    window = renderer.scene.window
+    # 先调用一次填充文字、云朵等缓存，只测稳定状态
+    queue.begin(window)
+    draw(queue)
+    queue.flush()
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        queue.begin(window)
+        draw(queue)
+        queue.flush()
+    elapsed = (time.perf_counter() - start) / repeats * 1e6
+    return elapsed, queue.command_count, queue.draw_calls
+
+
+def check_golden(name, surface, update):
+    """和基准画面比较，返回是否一致（更新模式下直接覆盖基准画面）"""
+    golden_dir = ResourceManager.get_project_root() / GameConfig.GOLDEN_FRAME_DIR
+    golden_path = golden_dir / f"{name}.png"
+    if update:
+        golden_dir.mkdir(parents=True, exist_ok=True)
+        pygame.image.save(surface, str(golden_path))
+        print(f"  💾 已更新基准画面 {golden_path.name}")
+        return True
+    if not golden_path.exists():
+        print(f"  ⚠️  没有基准画面 {golden_path.name}，请先运行 --update-golden")
+        return False
+
+    golden = pygame.image.load(str(golden_path))
+    if (golden.get_size() == surface.get_size() and
+            pygame.image.tobytes(golden, "RGB") == pygame.image.tobytes(surface, "RGB")):
+        print(f"  ✅ 与基准画面一致")
+        return True
+    actual_path = golden_dir / f"{name}.actual.png"
+    pygame.image.save(surface, str(actual_path))
+    print(f"  ❌ 与基准画面不一致，实际画面已保存到 {actual_path.name}")
+    return False
+
+
+def main():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    update = "--update-golden" in sys.argv[1:]
+    # 基准画面只取决于固定状态，不受脏矩形等运行时开关影响
+    GameConfig.DIRTY_RECT_RENDERING = False
+
+    renderer = OffscreenRenderer()
+    all_match = True
+    for name, (scene_name, cat_state, game_time) in make_fixtures().items():
+        print(f"📊 {name}（{scene_name}）")
+        surface = renderer.render_surface(cat_state, game_time, scene_name)
+        all_match = check_golden(name, surface, update) and all_match
+
+        for label, draw in get_renderers(renderer).items():
+            elapsed, commands, draw_calls = bench(renderer, draw, GameConfig.BENCH_REPEATS)
+            print(f"  {label}: {elapsed:.1f}µs/次，{commands}条命令，{draw_calls}次绘制调用")
+
+    pygame.quit()
+    if not all_match:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# src/utilis/build_manifest.py
+"""资源清单生成命令：python -m src.utilis.build_manifest [--check]"""
+
+import os
+import sys
+import pygame
+from src.systems.asset_manifest import AssetManifest
+
+
+def main():
+    """生成 assets/manifest.json，带 --check 时只检查现有清单是否过期"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    if "--check" in sys.argv:
+        manifest = AssetManifest.load()
+        stale_paths = manifest.check_stale(deep=True) if manifest else None
+        pygame.quit()
+        if manifest is None or stale_paths:
+            sys.exit(1)
+        print("✅ 资源清单与磁盘文件一致")
+        return
+
+    AssetManifest.build()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
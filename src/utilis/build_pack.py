@@ -0,0 +1,13 @@
+# src/utilis/build_pack.py
+"""资源打包命令：python -m src.utilis.build_pack"""
+
+from src.systems.asset_pack import AssetPack
+
+
+def main():
+    """把 assets 目录打包成 GameConfig.ASSET_PACK_FILE"""
+    AssetPack.build()
+
+
+if __name__ == "__main__":
+    main()
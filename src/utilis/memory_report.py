@@ -0,0 +1,45 @@
+# src/utilis/memory_report.py
+"""动画帧内存报告：python -m src.utilis.memory_report
+
+分别用普通32位表面和紧凑存储（调色板/RLE）加载全部动画，比较内存占用和blit耗时。
+"""
+
+import os
+import pygame
+from src.config.game_config import GameConfig
+from src.systems.resource_manager import ResourceManager
+from src.systems.animation_store import AnimationStore
+
+
+def collect(compact):
+    """按指定存储模式加载全部动画并生成报告"""
+    GameConfig.COMPACT_FRAMES = compact
+    animations = ResourceManager.load_all_animations()
+    return AnimationStore.from_animations(animations).memory_report(measure_blits=True)
+
+
+def main():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode(GameConfig.ROOM_WINDOW_SIZE)
+    # 图集分发的是子表面，无法单独压缩，这里只比较散装帧
+    GameConfig.USE_TEXTURE_ATLAS = False
+
+    reports = {"32位": collect(False), "紧凑": collect(True)}
+
+    print("📊 对比（每个场景）")
+    for scene_type in GameConfig.CAT_SCENE_SIZES:
+        totals = {}
+        for mode, report in reports.items():
+            states = report[scene_type].values()
+            blits = [entry["blit_us"] for entry in states if "blit_us" in entry]
+            totals[mode] = (sum(entry["bytes"] for entry in states), sum(blits) / len(blits) if blits else 0)
+        (full_bytes, full_blit), (compact_bytes, compact_blit) = totals.values()
+        saving = 1 - compact_bytes / full_bytes if full_bytes else 0
+        print(f"  {scene_type}: {full_bytes / 1024:.1f}KB -> {compact_bytes / 1024:.1f}KB（节省 {saving:.0%}），"
+              f"平均blit {full_blit:.2f}µs -> {compact_blit:.2f}µs")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# src/utilis/prewarm.py
+"""无头预热命令：python -m src.utilis.prewarm
+
+不创建窗口，加载全部动画和UI图片，填充帧缓存并输出加载耗时（可在服务器或CI上运行）。
+"""
+
+import time
+import pygame
+from src.systems.resource_manager import ResourceManager
+from src.systems.frame_cache import FrameCache
+
+
+def main():
+    """无头加载所有资源两遍：第一遍填充帧缓存，第二遍测量命中缓存后的耗时"""
+    for label in ("冷启动", "热启动"):
+        FrameCache.hits = FrameCache.misses = 0
+        start = time.perf_counter()
+        animations = ResourceManager.load_all_animations()
+        ui_images = ResourceManager.load_ui_images()
+        elapsed = time.perf_counter() - start
+        if animations is None or ui_images is None:
+            print("❌ 资源加载失败")
+            return
+        print(f"📊 {label}: {elapsed * 1000:.1f}ms，帧缓存命中 {FrameCache.hits} / 未命中 {FrameCache.misses}")
+    print(f"✅ 预热完成（显示模式：{'有' if ResourceManager.has_display() else '无'}）")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# src/utilis/simulate.py
+"""无头模拟命令：python -m src.utilis.simulate [天数] [main|room]
+
+不创建窗口、不加载资源、不自动存档，不限速地模拟宠物若干天的生活，用于测试和数值调整。
+"""
+
+import sys
+import time
+from src.core.simulation import Simulation
+
+
+def main():
+    days = float(sys.argv[1]) if len(sys.argv) > 1 else 7
+    scene_name = sys.argv[2] if len(sys.argv) > 2 else "main"
+
+    simulation = Simulation(autosave=False)
+    ticks = Simulation.ticks_for(days=days)
+    start = time.perf_counter()
+    simulation.run(ticks, scene_name, seed=0)
+    elapsed = time.perf_counter() - start
+
+    stats = simulation.get_stats()
+    print(f"📊 模拟{days:g}天（{scene_name}）：{ticks}个tick，耗时 {elapsed * 1000:.1f}ms")
+    print(f"  当前 {stats['game_hour']}点，游戏时长 {stats['play_time']:.0f}秒")
+    print(f"  Health {stats['health']}（最低 {stats['min_health']}），Mood {stats['mood']}（最低 {stats['min_mood']}）")
+    print(f"  当前需求：{stats['current_needs'] or '无'}")
+
+
+if __name__ == "__main__":
+    main()